@@ -0,0 +1,30 @@
+"""add (user_id, updated_at DESC) index to conversations
+
+Revision ID: add_conversations_user_updated_index
+Revises: prompt_tables_uuid_server_default
+Create Date: 2025-01-21
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_conversations_user_updated_index'
+down_revision = 'prompt_tables_uuid_server_default'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Matches list_conversations' WHERE user_id = ? ORDER BY updated_at DESC,
+    # so a page is read straight off the index instead of scan + sort
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_conversations_user_updated "
+            "ON conversations (user_id, updated_at DESC)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_conversations_user_updated")
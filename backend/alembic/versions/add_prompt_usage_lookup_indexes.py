@@ -0,0 +1,35 @@
+"""add turn_id and template_id indexes to prompt_usage
+
+Revision ID: add_prompt_usage_lookup_indexes
+Revises: add_conversations_user_updated_index
+Create Date: 2025-01-21
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_prompt_usage_lookup_indexes'
+down_revision = 'add_conversations_user_updated_index'
+branch_labels = None
+depends_on = None
+
+# Append-only and one row per cleaned turn, so these lookups otherwise
+# scan the whole table: turn analysis by turn_id, template performance
+# by template_id
+INDEXES = {
+    'idx_prompt_usage_turn': 'turn_id',
+    'idx_prompt_usage_template': 'template_id',
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column in INDEXES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON prompt_usage ({column})")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
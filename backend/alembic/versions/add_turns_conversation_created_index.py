@@ -0,0 +1,31 @@
+"""add (conversation_id, created_at) index to turns
+
+Revision ID: add_turns_conversation_created_index
+Revises: convert_json_columns_to_jsonb
+Create Date: 2025-01-20
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_turns_conversation_created_index'
+down_revision = 'convert_json_columns_to_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves "turns for conversation X ordered by created_at" (turn listing and
+    # context reload) as an ordered index range scan instead of scan + sort.
+    # CONCURRENTLY cannot run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_turns_conversation_created "
+            "ON turns (conversation_id, created_at)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_turns_conversation_created")
@@ -0,0 +1,42 @@
+"""convert json columns to jsonb
+
+Revision ID: convert_json_columns_to_jsonb
+Revises: 004, add_gemini_query_details
+Create Date: 2025-01-20
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'convert_json_columns_to_jsonb'
+down_revision = ('004', 'add_gemini_query_details')
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs created as text-based json by earlier revisions
+JSON_COLUMNS = [
+    ('turns', 'timing_breakdown'),
+    ('prompt_templates', 'variables'),
+    ('prompt_usage', 'variables_used'),
+]
+
+
+def upgrade() -> None:
+    # jsonb is stored pre-parsed, so reads no longer re-parse the text on every access
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using=f'{column}::jsonb'
+        )
+
+
+def downgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSON(astext_type=sa.Text()),
+            postgresql_using=f'{column}::json'
+        )
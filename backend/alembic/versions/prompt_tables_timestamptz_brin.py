@@ -0,0 +1,56 @@
+"""store prompt engineering timestamps as timestamptz and add BRIN indexes
+
+Revision ID: prompt_tables_timestamptz_brin
+Revises: add_turns_conversation_created_index
+Create Date: 2025-01-20
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'prompt_tables_timestamptz_brin'
+down_revision = 'add_turns_conversation_created_index'
+branch_labels = None
+depends_on = None
+
+# Naive timestamp columns created by 004; values were written as UTC
+TIMESTAMP_COLUMNS = {
+    'prompt_templates': ['created_at', 'updated_at'],
+    'prompt_usage': ['created_at'],
+    'ab_tests': ['created_at', 'ended_at'],
+    'ab_test_results': ['created_at'],
+}
+
+# Append-only tables whose created_at grows with physical row order
+BRIN_TABLES = ['prompt_usage', 'ab_test_results']
+
+
+def _alter_types(table: str, columns: list, target: str, using: str) -> None:
+    # One ALTER TABLE per table so each table is rewritten once, not once per column
+    clauses = ", ".join(
+        f"ALTER COLUMN {column} TYPE {target} USING {column} {using}"
+        for column in columns
+    )
+    op.execute(f"ALTER TABLE {table} {clauses}")
+
+
+def upgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        _alter_types(table, columns, 'timestamptz', "AT TIME ZONE 'UTC'")
+
+    with op.get_context().autocommit_block():
+        for table in BRIN_TABLES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_{table}_created_brin "
+                f"ON {table} USING BRIN (created_at) WITH (pages_per_range = 32)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in BRIN_TABLES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS idx_{table}_created_brin")
+
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        _alter_types(table, columns, 'timestamp', "AT TIME ZONE 'UTC'")
@@ -0,0 +1,29 @@
+"""default prompt engineering primary keys to gen_random_uuid()
+
+Revision ID: prompt_tables_uuid_server_default
+Revises: prompt_tables_timestamptz_brin
+Create Date: 2025-01-20
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'prompt_tables_uuid_server_default'
+down_revision = 'prompt_tables_timestamptz_brin'
+branch_labels = None
+depends_on = None
+
+TABLES = ['prompt_templates', 'prompt_usage', 'ab_tests', 'ab_test_results']
+
+
+def upgrade() -> None:
+    # 004 created these ids without a database-side default
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
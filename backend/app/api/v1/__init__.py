@@ -1,14 +1,46 @@
-from fastapi import APIRouter
+import importlib
+from fastapi import FastAPI
+from app.core.config import settings
 
-api_router = APIRouter()
+# Route modules are imported when the routes are included, not when this package is
+# imported, so importing one module (e.g. in a test) doesn't pull in the rest.
+# (module, prefix, tags)
+ROUTE_MODULES = [
+    ("health", "", ["health"]),
+    ("auth", "/auth", ["authentication"]),
+    ("conversations", "/conversations", ["conversations"]),
+    ("prompt_engineering", "/prompt-engineering", ["prompt-engineering"]),
+]
 
-# Import and include route modules
-from . import health, auth, conversations, prompt_engineering
+# NOTE: turns.py endpoints have been moved to conversations.py to fix routing conflicts
+# The /{conversation_id}/turns endpoint is now available at /api/v1/conversations/{id}/turns
 
-api_router.include_router(health.router, tags=["health"])
-api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
-api_router.include_router(conversations.router, prefix="/conversations", tags=["conversations"])
-api_router.include_router(prompt_engineering.router, prefix="/prompt-engineering", tags=["prompt-engineering"])
+def _enabled_route_modules():
+    """ROUTE_MODULES filtered by SIDELINE_MODULES; disabled modules are never imported."""
+    if not settings.ENABLED_MODULES:
+        return ROUTE_MODULES
+    known = {name for name, _, _ in ROUTE_MODULES}
+    unknown = set(settings.ENABLED_MODULES) - known
+    if unknown:
+        raise ValueError(f"SIDELINE_MODULES names unknown route modules: {', '.join(sorted(unknown))}")
+    return [entry for entry in ROUTE_MODULES if entry[0] in settings.ENABLED_MODULES]
 
-# NOTE: turns.py endpoints have been moved to conversations.py to fix routing conflicts
-# The /{conversation_id}/turns endpoint is now available at /api/v1/conversations/{id}/turns
\ No newline at end of file
+def _route_modules():
+    for name, prefix, tags in _enabled_route_modules():
+        yield importlib.import_module(f".{name}", __name__), prefix, tags
+
+def include_api_routes(app: FastAPI, prefix: str = "/api/v1") -> None:
+    """Include every v1 route module directly on the app.
+
+    Each include_router() call rebuilds the included routes, so going through
+    an intermediate v1 router built every route twice. Including the module
+    routers on the app directly builds each route once.
+    """
+    for module, module_prefix, tags in _route_modules():
+        app.include_router(module.router, prefix=prefix + module_prefix, tags=tags)
+
+def __getattr__(name: str):
+    # Route modules resolve on first attribute access (app.api.v1.conversations)
+    if name in {module for module, _, _ in ROUTE_MODULES}:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
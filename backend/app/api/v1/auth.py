@@ -1,10 +1,15 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from app.schemas.auth import LoginRequest, LoginResponse, RefreshRequest, RefreshResponse
+from app.schemas.auth import LoginRequest, LoginResponse, RefreshRequest, RefreshResponse, UserResponse
 from app.core.auth import auth_manager, get_current_user
 from datetime import datetime, timedelta
 
 router = APIRouter()
 
+def _build_login_response(auth_result: dict) -> LoginResponse:
+    """Wrap a server-built auth result without re-running Pydantic validation."""
+    user = UserResponse.model_construct(**auth_result["user"])
+    return LoginResponse.model_construct(**{**auth_result, "user": user})
+
 @router.post("/login", response_model=LoginResponse)
 async def login(request: LoginRequest):
     """User login endpoint with Supabase authentication."""
@@ -13,7 +18,7 @@ async def login(request: LoginRequest):
             request.email, 
             request.password
         )
-        return LoginResponse(**auth_result)
+        return _build_login_response(auth_result)
     except HTTPException:
         raise
     except Exception as e:
@@ -31,7 +36,7 @@ async def refresh_token(request: RefreshRequest):
             data={"sub": "user_id"},  # This would come from refresh token validation
             expires_delta=timedelta(hours=1)
         )
-        return RefreshResponse(
+        return RefreshResponse.model_construct(
             access_token=new_token,
             expires_in=3600
         )
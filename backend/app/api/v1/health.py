@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from app.core.database import get_db
-from datetime import datetime
+from datetime import datetime, timezone
 
 router = APIRouter()
 
@@ -21,7 +21,7 @@ async def health_check(db: Session = Depends(get_db)):
         "database": database_status,
         "supabase": "connected",
         "gemini_api": "available",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
         "version": "1.0.0",
         "environment": "development"
     }
\ No newline at end of file
@@ -6,6 +6,7 @@ import logging
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -28,6 +29,9 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 prompt_service = PromptEngineeringService()
 
+# Placeholder id for the built-in template served when the database has none
+BUILTIN_TEMPLATE_ID = UUID("00000000-0000-0000-0000-000000000001")
+
 
 @router.get("/templates", response_model=List[PromptTemplate])
 async def get_prompt_templates(
@@ -39,74 +43,51 @@ async def get_prompt_templates(
     
     # If no templates found (DB unavailable or empty), return default template
     if not templates:
-        from datetime import datetime
+        from datetime import datetime, timezone
         logger.info("No templates found, returning default template")
         return [
             PromptTemplate(
-                id="00000000-0000-0000-0000-000000000001",
+                id=BUILTIN_TEMPLATE_ID,
                 name="CleanerContext Default",
                 template=prompt_service.default_template,
                 description="Default prompt template for CleanerContext cleaning",
                 variables=["conversation_context", "raw_text", "cleaning_level"],
                 version="1.0.0",
                 is_active=True,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc)
             )
         ]
     
-    return [
-        PromptTemplate(
-            id=str(t.id),
-            name=t.name,
-            template=t.template,
-            description=t.description,
-            variables=t.variables,
-            version=t.version,
-            is_active=t.is_active,
-            created_at=t.created_at,
-            updated_at=t.updated_at
-        )
-        for t in templates
-    ]
+    return templates
 
 
 @router.get("/templates/{template_id}", response_model=PromptTemplate)
 async def get_prompt_template(
-    template_id: str,
+    template_id: UUID,
     db: Session = Depends(get_db)
 ):
     """Get a specific prompt template"""
     # Handle default template
-    if template_id == "00000000-0000-0000-0000-000000000001":
-        from datetime import datetime
+    if template_id == BUILTIN_TEMPLATE_ID:
+        from datetime import datetime, timezone
         return PromptTemplate(
-            id="00000000-0000-0000-0000-000000000001",
+            id=BUILTIN_TEMPLATE_ID,
             name="CleanerContext Default",
             template=prompt_service.default_template,
             description="Default prompt template for CleanerContext cleaning",
             variables=["conversation_context", "raw_text", "cleaning_level"],
             version="1.0.0",
             is_active=True,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc)
         )
     
-    template = await prompt_service.get_template(db, UUID(template_id))
+    template = await prompt_service.get_template(db, template_id)
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
     
-    return PromptTemplate(
-        id=str(template.id),
-        name=template.name,
-        template=template.template,
-        description=template.description,
-        variables=template.variables,
-        version=str(template.version),
-        is_active=template.is_active,
-        created_at=template.created_at,
-        updated_at=template.updated_at
-    )
+    return template
 
 
 @router.post("/templates", response_model=PromptTemplate)
@@ -124,18 +105,10 @@ async def create_prompt_template(
             variables=request.variables
         )
         
-        return PromptTemplate(
-            id=str(template.id),
-            name=template.name,
-            template=template.template,
-            description=template.description,
-            variables=template.variables,
-            version=template.version,
-            is_active=template.is_active,
-            created_at=template.created_at,
-            updated_at=template.updated_at
-        )
-    except Exception as e:
+        return template
+    except SQLAlchemyError as e:
+        # e.g. a duplicate name; anything else is a server error, not a bad request
+        db.rollback()
         raise HTTPException(status_code=400, detail=f"Failed to create template: {str(e)}")
 
 
@@ -152,17 +125,7 @@ async def update_prompt_template(
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
     
-    return PromptTemplate(
-        id=str(template.id),
-        name=template.name,
-        template=template.template,
-        description=template.description,
-        variables=template.variables,
-        version=template.version,
-        is_active=template.is_active,
-        created_at=template.created_at,
-        updated_at=template.updated_at
-    )
+    return template
 
 
 @router.post("/templates/{template_id}/activate")
@@ -234,8 +197,8 @@ async def create_ab_test(
         ab_test = await prompt_service.create_ab_test(
             db=db,
             name=request.name,
-            prompt_a_id=UUID(request.prompt_a_id),
-            prompt_b_id=UUID(request.prompt_b_id),
+            prompt_a_id=request.prompt_a_id,
+            prompt_b_id=request.prompt_b_id,
             description=request.description,
             traffic_split=request.traffic_split_percent
         )
@@ -250,7 +213,8 @@ async def create_ab_test(
             "is_active": ab_test.is_active,
             "created_at": ab_test.created_at
         }
-    except Exception as e:
+    except SQLAlchemyError as e:
+        db.rollback()
         raise HTTPException(status_code=400, detail=f"Failed to create A/B test: {str(e)}")
 
 
@@ -13,7 +13,7 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.auth import get_current_user
-from app.services.conversation_manager import ConversationManager
+from app.services.conversation_manager import conversation_manager
 from app.services.message_queue import message_queue_manager, QueueMetrics
 from app.models.conversation import Conversation
 from app.schemas.turns import TurnCreateRequest, TurnResponse
@@ -21,9 +21,6 @@ from app.schemas.turns import TurnCreateRequest, TurnResponse
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# Global conversation manager instance
-conversation_manager = ConversationManager()
-
 @router.post("/{conversation_id}/turns", response_model=TurnResponse)
 async def create_turn(
     conversation_id: UUID,
@@ -38,11 +35,11 @@ async def create_turn(
     - User turns: Full cleaning with context (<500ms)
     - Stateful: Uses cleaned history for better context
     """
-    print(f"\n[TurnsAPI] ===== NEW TURN REQUEST =====")
-    print(f"[TurnsAPI] Conversation ID: {conversation_id}")
-    print(f"[TurnsAPI] Speaker: {turn_data.speaker}")
-    print(f"[TurnsAPI] Raw text length: {len(turn_data.raw_text)} chars")
-    print(f"[TurnsAPI] User: test")
+    logger.debug("===== NEW TURN REQUEST =====")
+    logger.debug("Conversation ID: %s", conversation_id)
+    logger.debug("Speaker: %s", turn_data.speaker)
+    logger.debug("Raw text length: %s chars", len(turn_data.raw_text))
+    logger.debug("User: test")
     
     # Verify conversation exists (bypass user access for testing)
     try:
@@ -51,7 +48,7 @@ async def create_turn(
         ).first()
         
         if not conversation:
-            print(f"[TurnsAPI] ❌ Conversation not found, creating mock conversation")
+            logger.warning("⚠️ Conversation not found, creating mock conversation")
             # Create mock conversation for testing
             conversation = type('MockConversation', (), {
                 'id': conversation_id,
@@ -59,7 +56,7 @@ async def create_turn(
                 'turns_count': 0
             })()
     except Exception as e:
-        print(f"[TurnsAPI] ⚠️ Database error, using mock conversation: {e}")
+        logger.warning("⚠️ Database error, using mock conversation: %s", e)
         # Create mock conversation for testing
         conversation = type('MockConversation', (), {
             'id': conversation_id,
@@ -67,8 +64,8 @@ async def create_turn(
             'turns_count': 0
         })()
     
-    print(f"[TurnsAPI] ✅ Conversation verified: '{conversation.name}'")
-    print(f"[TurnsAPI] Current turns count: {conversation.turns_count}")
+    logger.debug("✅ Conversation verified: '%s'", conversation.name)
+    logger.debug("Current turns count: %s", conversation.turns_count)
     
     try:
         # Extract parameters from metadata
@@ -77,13 +74,13 @@ async def create_turn(
         model_params = turn_data.metadata.get('model_params') if turn_data.metadata else None
         skip_transcription_errors = turn_data.metadata.get('skip_transcription_errors', True) if turn_data.metadata else True
         
-        print(f"[TurnsAPI] Configuration: sliding_window={sliding_window_size}, cleaning_level={cleaning_level}")
-        print(f"[TurnsAPI] Skip transcription errors: {skip_transcription_errors}")
+        logger.debug("Configuration: sliding_window=%s, cleaning_level=%s", sliding_window_size, cleaning_level)
+        logger.debug("Skip transcription errors: %s", skip_transcription_errors)
         if model_params:
-            print(f"[TurnsAPI] Model params: {model_params}")
+            logger.debug("Model params: %s", model_params)
         
         # Process turn through ConversationManager
-        print(f"[TurnsAPI] 🚀 Delegating to ConversationManager...")
+        logger.debug("🚀 Delegating to ConversationManager...")
         result = await conversation_manager.add_turn(
             conversation_id=conversation_id,
             speaker=turn_data.speaker,
@@ -103,17 +100,16 @@ async def create_turn(
             # Mock conversation - just increment in memory
             conversation.turns_count = getattr(conversation, 'turns_count', 0) + 1
         
-        print(f"[TurnsAPI] ✅ Turn processed successfully")
-        print(f"[TurnsAPI] Turn ID: {result['turn_id']}")
-        print(f"[TurnsAPI] Processing time: {result['metadata']['processing_time_ms']:.2f}ms")
-        print(f"[TurnsAPI] Cleaning applied: {result['metadata']['cleaning_applied']}")
-        print(f"[TurnsAPI] Updated conversation turns count: {conversation.turns_count}")
+        logger.debug("✅ Turn processed successfully")
+        logger.debug("Turn ID: %s", result['turn_id'])
+        logger.debug("Processing time: %.2fms", result['metadata']['processing_time_ms'])
+        logger.debug("Cleaning applied: %s", result['metadata']['cleaning_applied'])
+        logger.debug("Updated conversation turns count: %s", conversation.turns_count)
         
         return TurnResponse(**result)
         
     except Exception as e:
-        logger.error(f"Turn processing failed: {str(e)}")
-        print(f"[TurnsAPI] ❌ Turn processing failed: {str(e)}")
+        logger.error("Turn processing failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Turn processing failed: {str(e)}"
@@ -134,7 +130,7 @@ async def get_turn_gemini_details(
     - Detailed timing breakdown
     - All metadata for debugging
     """
-    print(f"[TurnsAPI] Getting Gemini details for turn {turn_id}")
+    logger.debug("Getting Gemini details for turn %s", turn_id)
     
     # Get the turn from database
     from app.models.turn import Turn
@@ -181,8 +177,8 @@ async def get_conversation_turns(
     Get turns for a conversation with pagination.
     Returns both raw and cleaned versions for analysis.
     """
-    print(f"[TurnsAPI] Getting turns for conversation {conversation_id}")
-    print(f"[TurnsAPI] Pagination: limit={limit}, offset={offset}")
+    logger.debug("Getting turns for conversation %s", conversation_id)
+    logger.debug("Pagination: limit=%s, offset=%s", limit, offset)
     
     # Verify conversation access (bypass for testing)
     conversation = db.query(Conversation).filter(
@@ -201,7 +197,7 @@ async def get_conversation_turns(
         Turn.conversation_id == conversation_id
     ).order_by(Turn.created_at.asc()).offset(offset).limit(limit).all()
     
-    print(f"[TurnsAPI] Found {len(turns)} turns")
+    logger.debug("Found %s turns", len(turns))
     
     # Format response
     formatted_turns = []
@@ -242,7 +238,7 @@ async def get_conversation_context(
     Get the current conversation context (cleaned sliding window).
     Useful for debugging and understanding the CleanerContext state.
     """
-    print(f"[TurnsAPI] Getting context for conversation {conversation_id}")
+    logger.debug("Getting context for conversation %s", conversation_id)
     
     # Skip conversation verification for testing - just use the ConversationManager state
     
@@ -251,7 +247,7 @@ async def get_conversation_context(
         conversation_state = conversation_manager.get_conversation_state(conversation_id)
         cleaned_context = conversation_state.get_cleaned_sliding_window()
         
-        print(f"[TurnsAPI] Context contains {len(cleaned_context)} turns")
+        logger.debug("Context contains %s turns", len(cleaned_context))
         
         return {
             'conversation_id': str(conversation_id),
@@ -261,7 +257,7 @@ async def get_conversation_context(
             'total_history_length': len(conversation_state.cleaned_history)
         }
     except Exception as e:
-        print(f"[TurnsAPI] Context error: {e}")
+        logger.warning("Context error: %s", e)
         return {
             'conversation_id': str(conversation_id),
             'sliding_window_size': 10,
@@ -280,12 +276,12 @@ async def get_performance_metrics(
     Get performance metrics for CleanerContext processing.
     Tracks Lumen bypass speed, user processing speed, etc.
     """
-    print(f"[TurnsAPI] Getting performance metrics")
+    logger.debug("Getting performance metrics")
     
     # Get global performance metrics
     metrics = conversation_manager.get_performance_metrics()
     
-    print(f"[TurnsAPI] Performance metrics retrieved")
+    logger.debug("Performance metrics retrieved")
     
     return {
         'conversation_id': str(conversation_id),
@@ -321,10 +317,10 @@ async def create_turn_realtime(
     import time
     request_start = time.time()
     
-    print(f"\n[TurnsAPI-RT] ===== REAL-TIME TURN REQUEST =====")
-    print(f"[TurnsAPI-RT] Conversation ID: {conversation_id}")
-    print(f"[TurnsAPI-RT] Speaker: {turn_data.speaker}")
-    print(f"[TurnsAPI-RT] Text: {turn_data.raw_text[:100]}...")
+    logger.debug("===== REAL-TIME TURN REQUEST =====")
+    logger.debug("Conversation ID: %s", conversation_id)
+    logger.debug("Speaker: %s", turn_data.speaker)
+    logger.debug("Text: %s...", turn_data.raw_text[:100])
     
     try:
         # Generate turn ID for tracking (this will be the actual turn ID in database)
@@ -342,33 +338,30 @@ async def create_turn_realtime(
         # For Week 3 testing: Process immediately to enable real-time simulation
         # In production, this would be handled by the queue workers
         try:
-            from app.services.conversation_manager import ConversationManager
-            conv_manager = ConversationManager()
-            
-            # Process the turn immediately
-            result = await conv_manager.add_turn(
+            # Process the turn immediately, reusing the shared manager's context
+            result = await conversation_manager.add_turn(
                 conversation_id=conversation_id,
                 speaker=turn_data.speaker,
                 raw_text=turn_data.raw_text,
                 db=db
             )
             
-            print(f"[TurnsAPI-RT] ✅ Turn processed immediately for testing")
-            print(f"[TurnsAPI-RT] Turn ID: {result.get('turn_id', 'unknown')}")
+            logger.debug("✅ Turn processed immediately for testing")
+            logger.debug("Turn ID: %s", result.get('turn_id', 'unknown'))
             
         except Exception as e:
-            print(f"[TurnsAPI-RT] ⚠️ Immediate processing failed: {e}")
+            logger.warning("⚠️ Immediate processing failed: %s", e)
             # Continue with queued processing
         
         queue_time = (time.time() - request_start) * 1000
         
-        print(f"[TurnsAPI-RT] ✅ Turn queued in {queue_time:.2f}ms")
-        print(f"[TurnsAPI-RT] Job ID: {job.job_id}")
-        print(f"[TurnsAPI-RT] Priority: {job.priority}")
+        logger.debug("✅ Turn queued in %.2fms", queue_time)
+        logger.debug("Job ID: %s", job.job_id)
+        logger.debug("Priority: %s", job.priority)
         
         # Performance warning
         if queue_time > 100:
-            print(f"[TurnsAPI-RT] ⚠️ Queue time exceeded target: {queue_time:.2f}ms > 100ms")
+            logger.warning("⚠️ Queue time exceeded target: %.2fms > 100ms", queue_time)
         
         return {
             'success': True,
@@ -383,8 +376,7 @@ async def create_turn_realtime(
         
     except Exception as e:
         error_time = (time.time() - request_start) * 1000
-        logger.error(f"Real-time turn queuing failed: {str(e)}")
-        print(f"[TurnsAPI-RT] ❌ Queuing failed in {error_time:.2f}ms: {str(e)}")
+        logger.error("Real-time turn queuing failed in %.2fms: %s", error_time, e)
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -400,15 +392,15 @@ async def get_queue_status(
     Get current message queue status and metrics.
     Useful for monitoring real-time processing performance.
     """
-    print(f"[TurnsAPI-RT] Getting queue status")
+    logger.debug("Getting queue status")
     
     try:
         metrics = await message_queue_manager.get_metrics()
         queue_length = await message_queue_manager.get_queue_length()
         
-        print(f"[TurnsAPI-RT] Queue metrics retrieved")
-        print(f"[TurnsAPI-RT] Queue length: {queue_length}")
-        print(f"[TurnsAPI-RT] Workers: {metrics.worker_count}")
+        logger.debug("Queue metrics retrieved")
+        logger.debug("Queue length: %s", queue_length)
+        logger.debug("Workers: %s", metrics.worker_count)
         
         return {
             'conversation_id': str(conversation_id),
@@ -431,7 +423,7 @@ async def get_queue_status(
         }
         
     except Exception as e:
-        logger.error(f"Failed to get queue status: {str(e)}")
+        logger.error("Failed to get queue status: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get queue status: {str(e)}"
@@ -446,12 +438,12 @@ async def reset_queue_metrics(
     Reset queue metrics for testing purposes.
     Useful when running performance test suites.
     """
-    print(f"[TurnsAPI-RT] Resetting queue metrics")
+    logger.debug("Resetting queue metrics")
     
     try:
         await message_queue_manager.reset_metrics()
         
-        print(f"[TurnsAPI-RT] ✅ Queue metrics reset")
+        logger.debug("✅ Queue metrics reset")
         
         return {
             'success': True,
@@ -460,7 +452,7 @@ async def reset_queue_metrics(
         }
         
     except Exception as e:
-        logger.error(f"Failed to reset queue metrics: {str(e)}")
+        logger.error("Failed to reset queue metrics: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to reset queue metrics: {str(e)}"
@@ -472,7 +464,7 @@ async def start_queue_workers() -> Dict[str, Any]:
     Start message queue workers for processing.
     Called automatically on app startup, but available for manual control.
     """
-    print(f"[TurnsAPI-RT] Starting queue workers")
+    logger.debug("Starting queue workers")
     
     try:
         # Initialize message queue if not already done
@@ -481,7 +473,7 @@ async def start_queue_workers() -> Dict[str, Any]:
         # Start workers
         await message_queue_manager.start_workers(conversation_manager)
         
-        print(f"[TurnsAPI-RT] ✅ Queue workers started")
+        logger.debug("✅ Queue workers started")
         
         return {
             'success': True,
@@ -490,7 +482,7 @@ async def start_queue_workers() -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Failed to start queue workers: {str(e)}")
+        logger.error("Failed to start queue workers: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to start queue workers: {str(e)}"
@@ -502,12 +494,12 @@ async def stop_queue_workers() -> Dict[str, Any]:
     Stop message queue workers.
     Useful for maintenance or testing.
     """
-    print(f"[TurnsAPI-RT] Stopping queue workers")
+    logger.debug("Stopping queue workers")
     
     try:
         await message_queue_manager.stop_workers()
         
-        print(f"[TurnsAPI-RT] ✅ Queue workers stopped")
+        logger.debug("✅ Queue workers stopped")
         
         return {
             'success': True,
@@ -515,7 +507,7 @@ async def stop_queue_workers() -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Failed to stop queue workers: {str(e)}")
+        logger.error("Failed to stop queue workers: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to stop queue workers: {str(e)}"
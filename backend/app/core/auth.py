@@ -1,5 +1,8 @@
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, Tuple
 from jose import JWTError, jwt
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -12,30 +15,65 @@ supabase: Client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVIC
 # Security scheme
 security = HTTPBearer()
 
+# Validated token claims are reused for at most this long (and never past exp)
+TOKEN_CACHE_TTL_SECONDS = 300
+TOKEN_CACHE_MAX_SIZE = 10_000
+
 class AuthManager:
     def __init__(self):
         self.jwt_secret = settings.JWT_SECRET_KEY
         self.algorithm = settings.JWT_ALGORITHM
         self.supabase_jwt_secret = settings.JWT_SECRET_KEY  # Supabase uses same secret
+        # token digest -> (cache expiry timestamp, decoded claims), oldest insertion first
+        self._token_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
     
     def verify_supabase_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Verify Supabase JWT token."""
+        cache_key = None
+        if settings.TOKEN_CACHE_ENABLED:
+            cache_key = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+            cached = self._token_cache.get(cache_key)
+            if cached is not None:
+                if cached[0] > time.time():
+                    # Hand out a copy so a caller mutating the claims can't alter the cache
+                    return dict(cached[1])
+                del self._token_cache[cache_key]
+        
         try:
             payload = jwt.decode(token, self.supabase_jwt_secret, algorithms=[self.algorithm])
             user_id = payload.get("sub")
             if user_id is None:
                 return None
-            return payload
         except JWTError:
             return None
+        
+        # Only successful validations are cached
+        if cache_key is not None:
+            self._cache_token(cache_key, payload)
+        return payload
+    
+    def _cache_token(self, cache_key: str, payload: Dict[str, Any]) -> None:
+        """Remember validated claims until min(exp, now + TTL)."""
+        now = time.time()
+        expires_at = now + TOKEN_CACHE_TTL_SECONDS
+        if isinstance(payload.get("exp"), (int, float)):
+            expires_at = min(expires_at, payload["exp"])
+        if expires_at <= now:
+            return
+        
+        # Evict the oldest insertion; expired entries elsewhere are dropped on lookup
+        if len(self._token_cache) >= TOKEN_CACHE_MAX_SIZE:
+            self._token_cache.popitem(last=False)
+        
+        self._token_cache[cache_key] = (expires_at, dict(payload))
     
     def create_access_token(self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
         """Create a new access token."""
         to_encode = data.copy()
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = datetime.now(timezone.utc) + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(hours=settings.JWT_EXPIRATION_HOURS)
+            expire = datetime.now(timezone.utc) + timedelta(hours=settings.JWT_EXPIRATION_HOURS)
         
         to_encode.update({"exp": expire})
         encoded_jwt = jwt.encode(to_encode, self.jwt_secret, algorithm=self.algorithm)
@@ -7,6 +7,10 @@ load_dotenv()
 class Settings:
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "300"))
     
     # Supabase
     SUPABASE_URL: str = os.getenv("NEXT_PUBLIC_SUPABASE_URL", "")
@@ -17,13 +21,17 @@ class Settings:
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "")
     JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
     JWT_EXPIRATION_HOURS: int = int(os.getenv("JWT_EXPIRATION_HOURS", "24"))
+    TOKEN_CACHE_ENABLED: bool = os.getenv("SIDELINE_TOKEN_CACHE", "enabled") != "disabled"
     
     # Gemini AI
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
     
     # Development
     DEBUG: bool = os.getenv("NODE_ENV", "development") == "development"
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
     BACKEND_URL: str = os.getenv("BACKEND_URL", "http://127.0.0.1:8000")
     FRONTEND_URL: str = os.getenv("FRONTEND_URL", "http://127.0.0.1:6173")
+    # Comma-separated v1 route modules to mount; unset mounts all of them
+    ENABLED_MODULES: list = [m.strip() for m in os.getenv("SIDELINE_MODULES", "").split(",") if m.strip()]
 
 settings = Settings()
\ No newline at end of file
@@ -1,22 +1,57 @@
+import os
+import time
+import uuid
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
 
+# Size the connection pool for Postgres so concurrent requests reuse
+# connections instead of queueing behind the default 5; SQLite (tests) keeps
+# its own pool class
+if settings.DATABASE_URL.startswith("sqlite"):
+    pool_options = {}
+else:
+    pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,  # Log SQL queries in development
     pool_pre_ping=True,   # Verify connections before using them
-    pool_recycle=3600     # Recycle connections every hour
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Drop connections before idle-timeout poolers do
+    **pool_options
 )
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create SessionLocal class. Sessions live for one request, so objects are not
+# expired on commit: reading them afterwards must not re-SELECT every row
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Create Base class for models
 Base = declarative_base()
 
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7) for high-insert primary keys.
+
+    The leading 48 bits are the Unix time in milliseconds, so new rows land at
+    the right edge of the primary key B-tree instead of scattering across it.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand_a = int.from_bytes(os.urandom(2), "big") & 0x0FFF
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFFFFFFFFFFFFFF
+    value = (
+        (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
 # Dependency to get database session
 def get_db():
     db = SessionLocal()
@@ -0,0 +1,21 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class UTCORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson, treating naive datetimes as UTC.
+
+    Responses returned as plain dicts (no response_model) are serialized
+    straight from Python objects, so UUIDs and datetimes need no manual
+    str()/isoformat() before returning them. UTC is written as "Z", matching
+    how pydantic formats the response_model endpoints.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
@@ -1,12 +1,18 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from app.api.v1 import api_router
+from app.api.v1 import include_api_routes
+from app.core.logging_config import setup_logging
+from app.core.responses import UTCORJSONResponse
+
+# Log through a background queue so handlers never block on stderr
+setup_logging()
 
 app = FastAPI(
     title="Lumen Transcript Cleaner API",
     description="AI-powered conversation cleaning system",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=UTCORJSONResponse
 )
 
 # CORS middleware for frontend communication
@@ -19,8 +25,8 @@ app.add_middleware(
     expose_headers=["*"]
 )
 
-# Include the main API router with all sub-routers
-app.include_router(api_router, prefix="/api/v1")
+# Include every v1 route module directly under /api/v1
+include_api_routes(app, prefix="/api/v1")
 
 @app.get("/")
 async def root():
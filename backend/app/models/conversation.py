@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Integer, JSON, ForeignKey
+from sqlalchemy import Column, String, DateTime, Integer, JSON, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -7,6 +7,10 @@ import uuid
 
 class Conversation(Base):
     __tablename__ = "conversations"
+    __table_args__ = (
+        # list_conversations pages per user, most recently updated first
+        Index("idx_conversations_user_updated", "user_id", text("updated_at DESC")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -20,4 +24,4 @@ class Conversation(Base):
 
     # Relationships
     user = relationship("User")
-    turns = relationship("Turn", back_populates="conversation", cascade="all, delete-orphan")
\ No newline at end of file
+    turns = relationship("Turn", back_populates="conversation", cascade="all, delete-orphan")
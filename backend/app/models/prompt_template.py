@@ -2,12 +2,12 @@
 Prompt Template Model - Database storage for prompt engineering
 """
 
-from sqlalchemy import Column, String, Text, Boolean, DateTime, JSON, Integer, Float
+from sqlalchemy import Column, String, Text, Boolean, DateTime, JSON, Integer, Float, Index
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
 import uuid
-from datetime import datetime
 
-from app.core.database import Base
+from app.core.database import Base, uuid7
 
 
 class PromptTemplate(Base):
@@ -21,8 +21,8 @@ class PromptTemplate(Base):
     variables = Column(JSON, nullable=False, default=list)  # List of variable names
     version = Column(String(50), nullable=False, default="1.0.0")
     is_active = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     def __repr__(self):
         return f"<PromptTemplate(name='{self.name}', version='{self.version}')>"
@@ -31,8 +31,13 @@ class PromptTemplate(Base):
 class PromptUsage(Base):
     """Track usage of prompt templates"""
     __tablename__ = "prompt_usage"
+    __table_args__ = (
+        # Usage is looked up per turn (turn analysis) and per template (performance)
+        Index("idx_prompt_usage_turn", "turn_id"),
+        Index("idx_prompt_usage_template", "template_id"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     template_id = Column(UUID(as_uuid=True), nullable=False)
     turn_id = Column(UUID(as_uuid=True), nullable=True)  # Link to turn if available
     conversation_id = Column(UUID(as_uuid=True), nullable=True)
@@ -43,7 +48,7 @@ class PromptUsage(Base):
     confidence_score = Column(String(10), nullable=True)
     corrections_count = Column(Integer, default=0)
     context_turns_used = Column(Integer, default=0)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     def __repr__(self):
         return f"<PromptUsage(template_id='{self.template_id}')>"
@@ -60,8 +65,8 @@ class ABTest(Base):
     prompt_b_id = Column(UUID(as_uuid=True), nullable=False)
     traffic_split_percent = Column(Integer, default=50)  # Percentage for prompt A
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    ended_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    ended_at = Column(DateTime(timezone=True), nullable=True)
 
     def __repr__(self):
         return f"<ABTest(name='{self.name}', active={self.is_active})>"
@@ -71,7 +76,7 @@ class ABTestResult(Base):
     """Results from A/B tests"""
     __tablename__ = "ab_test_results"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     test_id = Column(UUID(as_uuid=True), nullable=False)
     prompt_variant = Column(String(1), nullable=False)  # "A" or "B"
     turn_id = Column(UUID(as_uuid=True), nullable=True)
@@ -79,7 +84,7 @@ class ABTestResult(Base):
     confidence_score = Column(String(10), nullable=True)
     corrections_count = Column(Integer, default=0)
     success = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     def __repr__(self):
         return f"<ABTestResult(test_id='{self.test_id}', variant='{self.prompt_variant}')>"
\ No newline at end of file
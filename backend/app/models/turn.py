@@ -1,14 +1,17 @@
-from sqlalchemy import Column, String, DateTime, Text, JSON, ForeignKey, Float
+from sqlalchemy import Column, String, DateTime, Text, JSON, ForeignKey, Float, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.core.database import Base
-import uuid
+from app.core.database import Base, uuid7
 
 class Turn(Base):
     __tablename__ = "turns"
+    __table_args__ = (
+        # Turns are always read per conversation in chronological order
+        Index("idx_turns_conversation_created", "conversation_id", "created_at"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id"), nullable=False)
     speaker = Column(String, nullable=False)  # 'User' or 'Lumen'
     raw_text = Column(Text, nullable=False)
@@ -1,5 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, field_serializer
 from typing import Optional, Dict, Any, List
+from datetime import datetime, timezone
+from uuid import UUID
 
 class CreateConversationRequest(BaseModel):
     name: str
@@ -7,15 +9,20 @@ class CreateConversationRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 class ConversationResponse(BaseModel):
-    id: str
+    id: UUID
     name: str
     description: Optional[str] = None
     status: str  # 'active' | 'paused' | 'completed'
     turns_count: int
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
     metadata: Dict[str, Any]
 
+    @field_serializer('created_at', 'updated_at')
+    def serialize_timestamp(self, value: datetime) -> datetime:
+        # Naive values (e.g. from SQLite) are UTC, as in UTCORJSONResponse
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
 class ListConversationsResponse(BaseModel):
     conversations: List[ConversationResponse]
     total: int
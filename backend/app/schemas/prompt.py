@@ -3,13 +3,17 @@ Prompt Engineering Schema - For Prompt Dashboard API
 """
 
 from typing import Dict, List, Any, Optional
-from pydantic import BaseModel
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
 
 class PromptTemplate(BaseModel):
     """Core prompt template schema"""
-    id: str
+    # Handlers return PromptTemplate rows directly; FastAPI reads their attributes
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: UUID
     name: str
     template: str
     description: Optional[str] = None
@@ -119,8 +123,8 @@ class RenderPromptRequest(BaseModel):
 class CreateABTestRequest(BaseModel):
     name: str
     description: Optional[str] = None
-    prompt_a_id: str
-    prompt_b_id: str
+    prompt_a_id: UUID
+    prompt_b_id: UUID
     traffic_split_percent: int = 50
 
 
@@ -8,19 +8,24 @@ cleaning using cleaned history in sliding window context.
 import time
 import logging
 import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Any
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func, insert, select, update
 
 from app.models.conversation import Conversation
 from app.models.turn import Turn
-from app.core.database import get_db
+from app.core.database import get_db, uuid7
 from app.services.gemini_service import GeminiService
 from app.services.prompt_engineering_service import PromptEngineeringService
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when rebuilding a conversation's history
+CONTEXT_LOAD_BATCH_SIZE = 500
+
 class ConversationState:
     """Manages the stateful context for a single conversation"""
     
@@ -30,50 +35,51 @@ class ConversationState:
         self.cleaned_history: List[Dict[str, Any]] = []
         self.context_patterns: Dict[str, Any] = {}
         
-        print(f"[ConversationState] Initialized for conversation {conversation_id}")
-        print(f"[ConversationState] Sliding window size: {self.sliding_window_size}")
+        logger.debug("Initialized for conversation %s", conversation_id)
+        logger.debug("Sliding window size: %s", self.sliding_window_size)
     
     def get_cleaned_sliding_window(self) -> List[Dict[str, Any]]:
         """Get the cleaned conversation history for context (NOT raw text)"""
-        print(f"[ConversationState] 🔍 SLIDING WINDOW DEBUG: Getting sliding window")
-        print(f"[ConversationState] 📊 SLIDING WINDOW DEBUG: Current history length: {len(self.cleaned_history)}")
-        print(f"[ConversationState] 🎯 SLIDING WINDOW DEBUG: Window size configured: {self.sliding_window_size}")
+        logger.debug("🔍 SLIDING WINDOW DEBUG: Getting sliding window")
+        logger.debug("📊 SLIDING WINDOW DEBUG: Current history length: %s", len(self.cleaned_history))
+        logger.debug("🎯 SLIDING WINDOW DEBUG: Window size configured: %s", self.sliding_window_size)
         
         # Debug: Log ALL history before windowing
-        if len(self.cleaned_history) > 0:
-            print(f"[ConversationState] 📋 SLIDING WINDOW DEBUG: All available history:")
+        if self.cleaned_history and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📋 SLIDING WINDOW DEBUG: All available history:")
             for i, turn in enumerate(self.cleaned_history):
-                print(f"[ConversationState]   History[{i}]: {turn['speaker']} - '{turn['cleaned_text'][:60]}...'")
+                logger.debug("History[%s]: %s - '%s...'", i, turn['speaker'], turn['cleaned_text'][:60])
         
         # Return last N turns of CLEANED conversation history
         window = self.cleaned_history[-self.sliding_window_size:]
         
-        print(f"[ConversationState] ✂️ SLIDING WINDOW DEBUG: Sliding window contains {len(window)} turns")
-        print(f"[ConversationState] 🎯 SLIDING WINDOW DEBUG: Window range: turns {max(0, len(self.cleaned_history) - self.sliding_window_size)} to {len(self.cleaned_history)}")
+        logger.debug("✂️ SLIDING WINDOW DEBUG: Sliding window contains %s turns", len(window))
+        logger.debug("🎯 SLIDING WINDOW DEBUG: Window range: turns %s to %s", max(0, len(self.cleaned_history) - self.sliding_window_size), len(self.cleaned_history))
         
-        if len(window) > 0:
-            print(f"[ConversationState] 📋 SLIDING WINDOW DEBUG: Window contents:")
-            for i, turn in enumerate(window):
-                actual_turn_num = len(self.cleaned_history) - len(window) + i + 1
-                print(f"[ConversationState]   Window[{i}] (Turn {actual_turn_num}): {turn['speaker']} -> '{turn['cleaned_text'][:80]}...'")
-        else:
-            print(f"[ConversationState] ❌ SLIDING WINDOW DEBUG: Window is empty!")
+        if logger.isEnabledFor(logging.DEBUG):
+            if len(window) > 0:
+                logger.debug("📋 SLIDING WINDOW DEBUG: Window contents:")
+                for i, turn in enumerate(window):
+                    actual_turn_num = len(self.cleaned_history) - len(window) + i + 1
+                    logger.debug("Window[%s] (Turn %s): %s -> '%s...'", i, actual_turn_num, turn['speaker'], turn['cleaned_text'][:80])
+            else:
+                logger.debug("❌ SLIDING WINDOW DEBUG: Window is empty!")
         
         return window
     
     def add_to_history(self, turn_data: Dict[str, Any]):
         """Add a processed turn to the cleaned history"""
-        print(f"[ConversationState] Adding turn to history: {turn_data['speaker']}")
-        print(f"[ConversationState] Raw text: '{turn_data['raw_text'][:100]}...'")
-        print(f"[ConversationState] Cleaned text: '{turn_data['cleaned_text'][:100]}...'")
+        logger.debug("Adding turn to history: %s", turn_data['speaker'])
+        logger.debug("Raw text: '%s...'", turn_data['raw_text'][:100])
+        logger.debug("Cleaned text: '%s...'", turn_data['cleaned_text'][:100])
         
         self.cleaned_history.append(turn_data)
         
-        print(f"[ConversationState] History now contains {len(self.cleaned_history)} turns")
+        logger.debug("History now contains %s turns", len(self.cleaned_history))
     
     def update_context_patterns(self, patterns: Dict[str, Any]):
         """Track patterns detected in this conversation"""
-        print(f"[ConversationState] Updating context patterns: {patterns}")
+        logger.debug("Updating context patterns: %s", patterns)
         self.context_patterns.update(patterns)
 
 
@@ -95,60 +101,62 @@ class ConversationManager:
             'context_retrieval_times': []
         }
         
-        print("[ConversationManager] Initialized with stateful conversation tracking and Gemini 2.5 Flash")
-        print("[ConversationManager] Performance metrics tracking enabled")
-        print("[ConversationManager] Prompt Engineering Service integrated")
+        logger.debug("Initialized with stateful conversation tracking and Gemini 2.5 Flash")
+        logger.debug("Performance metrics tracking enabled")
+        logger.debug("Prompt Engineering Service integrated")
     
     def get_conversation_state(self, conversation_id: UUID, sliding_window_size: int = 10, db: Session = None) -> ConversationState:
         """Get or create conversation state for stateful processing"""
-        print(f"[ConversationManager] Getting conversation state for {conversation_id}")
+        logger.debug("Getting conversation state for %s", conversation_id)
         
         if conversation_id not in self.active_conversations:
-            print(f"[ConversationManager] Creating new conversation state for {conversation_id}")
+            logger.debug("Creating new conversation state for %s", conversation_id)
             self.active_conversations[conversation_id] = ConversationState(conversation_id, sliding_window_size)
             
             # Load existing turns from database to rebuild context
             self._load_existing_context(conversation_id, db)
         else:
-            print(f"[ConversationManager] Using existing conversation state for {conversation_id}")
+            logger.debug("Using existing conversation state for %s", conversation_id)
             # Update sliding window size if provided
             if sliding_window_size != 10:  # Only update if different from default
                 self.active_conversations[conversation_id].sliding_window_size = sliding_window_size
-                print(f"[ConversationManager] Updated sliding window size to {sliding_window_size}")
+                logger.debug("Updated sliding window size to %s", sliding_window_size)
         
         return self.active_conversations[conversation_id]
     
     def _load_existing_context(self, conversation_id: UUID, db: Session = None):
         """Load existing turns from database to rebuild conversation context"""
-        print(f"[ConversationManager] 🔍 CONTEXT DEBUG: Loading existing context for conversation {conversation_id}")
+        logger.debug("🔍 CONTEXT DEBUG: Loading existing context for conversation %s", conversation_id)
         
         if not db:
-            print(f"[ConversationManager] ❌ CONTEXT DEBUG: No database session available - starting with fresh context")
+            logger.debug("❌ CONTEXT DEBUG: No database session available - starting with fresh context")
             return
         
         try:
-            # Query existing turns for this conversation, ordered chronologically
-            print(f"[ConversationManager] 🔍 CONTEXT DEBUG: Querying database for existing turns...")
-            existing_turns = db.query(Turn).filter(
-                Turn.conversation_id == conversation_id
-            ).order_by(Turn.created_at.asc()).all()
-            
-            print(f"[ConversationManager] 📊 CONTEXT DEBUG: Found {len(existing_turns)} existing turns in database")
-            
-            if not existing_turns:
-                print(f"[ConversationManager] ❌ CONTEXT DEBUG: No existing turns found - starting with fresh context")
-                return
-            
             # Get the conversation state for this conversation
             conversation_state = self.active_conversations.get(conversation_id)
             if not conversation_state:
-                print(f"[ConversationManager] ❌ CONTEXT DEBUG: No conversation state found for {conversation_id}")
+                logger.debug("❌ CONTEXT DEBUG: No conversation state found for %s", conversation_id)
                 return
             
-            print(f"[ConversationManager] 🔍 CONTEXT DEBUG: Starting to load {len(existing_turns)} turns into context...")
+            # Stream only the history columns, ordered chronologically; the
+            # Gemini prompt/response text never enters the context, and long
+            # conversations are read in batches rather than as one full result
+            logger.debug("🔍 CONTEXT DEBUG: Querying database for existing turns...")
+            existing_turns = db.execute(
+                select(
+                    Turn.speaker, Turn.raw_text, Turn.cleaned_text, Turn.confidence_score,
+                    Turn.cleaning_applied, Turn.cleaning_level, Turn.processing_time_ms,
+                    Turn.corrections, Turn.context_detected, Turn.ai_model_used
+                )
+                .where(Turn.conversation_id == conversation_id)
+                .order_by(Turn.created_at.asc())
+                .execution_options(yield_per=CONTEXT_LOAD_BATCH_SIZE)
+            )
             
             # Convert database turns to conversation state format
-            for i, turn in enumerate(existing_turns):
+            loaded = 0
+            for turn in existing_turns:
                 turn_data = {
                     'conversation_id': conversation_id,
                     'speaker': turn.speaker,
@@ -165,33 +173,37 @@ class ConversationManager:
                 
                 # Add to conversation state history
                 conversation_state.cleaned_history.append(turn_data)
+                loaded += 1
                 
                 # Enhanced logging for each turn
-                print(f"[ConversationManager] 📝 CONTEXT DEBUG: Loaded Turn {i+1}: {turn.speaker}")
-                print(f"[ConversationManager]   ↳ Raw: '{turn.raw_text[:60]}...'")
-                print(f"[ConversationManager]   ↳ Cleaned: '{turn.cleaned_text[:60]}...'")
-                print(f"[ConversationManager]   ↳ Added to history (total: {len(conversation_state.cleaned_history)})")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("📝 CONTEXT DEBUG: Loaded Turn %s: %s", loaded, turn.speaker)
+                    logger.debug("↳ Raw: '%s...'", turn.raw_text[:60])
+                    logger.debug("↳ Cleaned: '%s...'", turn.cleaned_text[:60])
+                    logger.debug("↳ Added to history (total: %s)", len(conversation_state.cleaned_history))
+            
+            if not loaded:
+                logger.debug("❌ CONTEXT DEBUG: No existing turns found - starting with fresh context")
+                return
             
-            print(f"[ConversationManager] ✅ CONTEXT DEBUG: Successfully loaded {len(existing_turns)} turns into conversation context")
-            print(f"[ConversationManager] 📈 CONTEXT DEBUG: Total history length: {len(conversation_state.cleaned_history)}")
-            print(f"[ConversationManager] 🎯 CONTEXT DEBUG: Context spans from turn 1 to turn {len(existing_turns)}")
+            logger.debug("✅ CONTEXT DEBUG: Successfully loaded %s turns into conversation context", loaded)
+            logger.debug("📈 CONTEXT DEBUG: Total history length: %s", len(conversation_state.cleaned_history))
+            logger.debug("🎯 CONTEXT DEBUG: Context spans from turn 1 to turn %s", loaded)
             
             # Log ALL turns for debugging
-            if len(conversation_state.cleaned_history) > 0:
-                print(f"[ConversationManager] 📋 CONTEXT DEBUG: Complete context history:")
+            if conversation_state.cleaned_history and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📋 CONTEXT DEBUG: Complete context history:")
                 for i, turn in enumerate(conversation_state.cleaned_history):
-                    print(f"[ConversationManager]   Turn {i+1}: {turn['speaker']} - '{turn['cleaned_text'][:80]}...'")
+                    logger.debug("Turn %s: %s - '%s...'", i + 1, turn['speaker'], turn['cleaned_text'][:80])
                     
         except Exception as e:
-            print(f"[ConversationManager] ❌ CONTEXT DEBUG: Failed to load existing context: {e}")
-            print(f"[ConversationManager] ❌ CONTEXT DEBUG: Exception type: {type(e).__name__}")
-            print(f"[ConversationManager] ❌ CONTEXT DEBUG: Continuing with fresh context")
-            import traceback
-            traceback.print_exc()
+            logger.error("❌ CONTEXT DEBUG: Failed to load existing context, continuing with fresh context: %s",
+                         e, exc_info=True)
     
     async def add_turn(self, conversation_id: UUID, speaker: str, raw_text: str, db: Session, 
                        sliding_window_size: int = 10, cleaning_level: str = "full", 
-                       model_params: Dict[str, Any] = None, skip_transcription_errors: bool = True) -> Dict[str, Any]:
+                       model_params: Dict[str, Any] = None, skip_transcription_errors: bool = True,
+                       pending_rows: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Core method: Add a turn to the conversation with stateful cleaning.
         
@@ -199,38 +211,117 @@ class ConversationManager:
         1. Skip Lumen turns (they're perfect) 
         2. For user turns, use cleaned history as context
         3. Apply intelligent cleaning based on context
+        
+        Lumen turns outside a bulk import skip the context load entirely and are
+        stored with a single INSERT ... RETURNING.
+        
+        When pending_rows is given the turn row is queued there instead of being
+        committed, so add_turns_bulk can write a whole batch in one INSERT.
         """
         start_time = time.time()
-        print(f"\n[ConversationManager] ===== PROCESSING NEW TURN =====")
-        print(f"[ConversationManager] Conversation: {conversation_id}")
-        print(f"[ConversationManager] Speaker: {speaker}")
-        print(f"[ConversationManager] Raw text: '{raw_text}'")
+        logger.debug("===== PROCESSING NEW TURN =====")
+        logger.debug("Conversation: %s", conversation_id)
+        logger.debug("Speaker: %s", speaker)
+        logger.debug("Raw text: '%s'", raw_text)
+        
+        is_transcription_error = skip_transcription_errors and self._is_likely_transcription_error(raw_text)
+        if pending_rows is None and not is_transcription_error and self._is_lumen_turn(speaker):
+            # Lumen turns need no context or cleaning - store them with one INSERT
+            logger.debug("🚀 LUMEN TURN DETECTED - Using fast path")
+            result = await self._add_lumen_turn_fast(conversation_id, speaker, raw_text, db)
+            total_time = (time.time() - start_time) * 1000
+            logger.debug("===== TURN COMPLETE in %.2fms =====", total_time)
+            return result
         
         conversation_state = self.get_conversation_state(conversation_id, sliding_window_size, db)
         
         # Check for transcription errors before processing
-        if skip_transcription_errors and self._is_likely_transcription_error(raw_text):
-            print(f"[ConversationManager] 🚫 TRANSCRIPTION ERROR DETECTED - Skipping processing")
-            print(f"[ConversationManager] Raw text flagged as error: '{raw_text}'")
-            result = await self._process_transcription_error(conversation_id, speaker, raw_text, conversation_state, db)
+        if is_transcription_error:
+            logger.debug("🚫 TRANSCRIPTION ERROR DETECTED - Skipping processing")
+            logger.debug("Raw text flagged as error: '%s'", raw_text)
+            result = await self._process_transcription_error(conversation_id, speaker, raw_text, conversation_state, db, pending_rows)
         elif self._is_lumen_turn(speaker):
-            print(f"[ConversationManager] 🚀 LUMEN TURN DETECTED - Using instant bypass")
-            result = await self._process_lumen_turn(conversation_id, speaker, raw_text, conversation_state, db)
+            logger.debug("🚀 LUMEN TURN DETECTED - Using instant bypass")
+            result = await self._process_lumen_turn(conversation_id, speaker, raw_text, conversation_state, db, pending_rows)
         else:
-            print(f"[ConversationManager] 👤 USER TURN DETECTED - Using full CleanerContext processing")
-            result = await self._process_user_turn(conversation_id, speaker, raw_text, conversation_state, db, cleaning_level, model_params)
+            logger.debug("👤 USER TURN DETECTED - Using full CleanerContext processing")
+            result = await self._process_user_turn(conversation_id, speaker, raw_text, conversation_state, db, cleaning_level, model_params, pending_rows)
         
         total_time = (time.time() - start_time) * 1000
-        print(f"[ConversationManager] ===== TURN COMPLETE in {total_time:.2f}ms =====\n")
+        logger.debug("===== TURN COMPLETE in %.2fms =====", total_time)
         
         return result
     
+    async def add_turns_bulk(self, conversation_id: UUID, turns: List[Dict[str, Any]], db: Session,
+                             batch_size: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Add many turns to a conversation, persisting them with multi-row INSERTs.
+        
+        Turns are processed in order through add_turn, so each user turn still
+        sees the cleaned history of the turns before it, but rows are written
+        batch_size at a time with a single commit instead of one commit per turn.
+        The turns, their prompt usage rows and the turns_count bump share that
+        commit, so a failed batch leaves none of them behind.
+        """
+        pending_rows: List[Dict[str, Any]] = []
+        results = []
+        conversation_state = self.get_conversation_state(conversation_id, db=db)
+        history_length = len(conversation_state.cleaned_history)
+        
+        try:
+            for turn in turns:
+                results.append(await self.add_turn(
+                    conversation_id=conversation_id, db=db, pending_rows=pending_rows, **turn
+                ))
+            
+            for start in range(0, len(pending_rows), batch_size):
+                db.execute(insert(Turn), pending_rows[start:start + batch_size])
+                # Let other requests run between batches of a large import
+                await asyncio.sleep(0)
+            if pending_rows:
+                self._bump_turns_count(db, conversation_id, len(pending_rows))
+            db.commit()
+        except Exception:
+            db.rollback()
+            # None of the batch was stored, so drop it from the in-memory history too
+            del conversation_state.cleaned_history[history_length:]
+            raise
+        
+        return results
+    
+    def _insert_turn(self, db: Session, turn_data: Dict[str, Any]):
+        """Insert and commit one turn; id and created_at are known up front, so no refresh"""
+        pending_rows: List[Dict[str, Any]] = []
+        db_turn = self._queue_turn(turn_data, pending_rows)
+        try:
+            db.execute(insert(Turn), pending_rows)
+            self._bump_turns_count(db, turn_data['conversation_id'], 1)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return db_turn
+    
+    def _bump_turns_count(self, db: Session, conversation_id: UUID, count: int) -> None:
+        """Increment conversations.turns_count in SQL, inside the caller's transaction"""
+        db.execute(
+            update(Conversation)
+            .where(Conversation.id == conversation_id)
+            .values(turns_count=func.coalesce(Conversation.turns_count, 0) + count)
+        )
+    
+    def _queue_turn(self, turn_data: Dict[str, Any], pending_rows: List[Dict[str, Any]]):
+        """Queue a turn row for add_turns_bulk, assigning id and created_at up front"""
+        row = dict(turn_data, id=uuid7(), created_at=datetime.now(timezone.utc))
+        pending_rows.append(row)
+        return SimpleNamespace(id=row['id'], created_at=row['created_at'])
+    
     def _is_lumen_turn(self, speaker: str) -> bool:
         """Detect if this is a Lumen/AI turn that should be bypassed"""
         lumen_speakers = ['Lumen', 'AI', 'Assistant', 'Claude']
         is_lumen = speaker in lumen_speakers
         
-        print(f"[ConversationManager] Turn classification: {speaker} -> {'LUMEN' if is_lumen else 'USER'}")
+        logger.debug("Turn classification: %s -> %s", speaker, 'LUMEN' if is_lumen else 'USER')
         return is_lumen
     
     def _is_likely_transcription_error(self, text: str) -> bool:
@@ -242,14 +333,14 @@ class ConversationManager:
         
         # Very short single character or symbol
         if len(text) <= 2:
-            print(f"[ConversationManager] Flagged as error: too short ({len(text)} chars)")
+            logger.debug("Flagged as error: too short (%s chars)", len(text))
             return True
         
         # Contains primarily non-Latin characters (Arabic, Thai, Chinese, etc.)
         # that are likely transcription errors in English conversations
         non_latin_chars = re.findall(r'[^\x00-\x7F\s]', text)
         if non_latin_chars and len(non_latin_chars) / len(text) > 0.3:
-            print(f"[ConversationManager] Flagged as error: high foreign character ratio ({len(non_latin_chars)}/{len(text)})")
+            logger.debug("Flagged as error: high foreign character ratio (%s/%s)", len(non_latin_chars), len(text))
             return True
         
         # Single foreign characters or symbols that are clearly errors
@@ -264,19 +355,20 @@ class ConversationManager:
         
         for pattern in foreign_error_patterns:
             if re.match(pattern, text):
-                print(f"[ConversationManager] Flagged as error: matches foreign script pattern")
+                logger.debug("Flagged as error: matches foreign script pattern")
                 return True
         
         return False
     
     async def _process_transcription_error(self, conversation_id: UUID, speaker: str, raw_text: str,
-                                         conversation_state: ConversationState, db: Session) -> Dict[str, Any]:
+                                         conversation_state: ConversationState, db: Session,
+                                         pending_rows: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Process detected transcription errors by skipping them with minimal processing.
         These are usually foreign characters or gibberish that shouldn't be processed.
         """
         process_start = time.time()
-        print(f"[ConversationManager] 🚫 Processing transcription error with skip")
+        logger.debug("🚫 Processing transcription error with skip")
         
         # Skip processing - mark as transcription error with empty cleaned text
         cleaned_text = ""  # Empty - indicates skipped
@@ -306,30 +398,24 @@ class ConversationManager:
         
         # Save to database (with error handling for testing)
         try:
-            db_turn = Turn(**turn_data)
-            db.add(db_turn)
-            db.commit()
-            db.refresh(db_turn)
-            
-            # Ensure created_at is available for response (for testing)
-            if not hasattr(db_turn, 'created_at') or db_turn.created_at is None:
-                from datetime import datetime
-                db_turn.created_at = datetime.utcnow()
+            if pending_rows is not None:
+                db_turn = self._queue_turn(turn_data, pending_rows)
+            else:
+                db_turn = self._insert_turn(db, turn_data)
         except Exception as e:
-            print(f"[ConversationManager] ⚠️ Database error (continuing with mock): {e}")
+            logger.warning("⚠️ Database error (continuing with mock): %s", e)
             # Mock response for testing
-            from datetime import datetime
             class MockTurn:
                 def __init__(self):
                     self.id = "mock-transcription-error"
-                    self.created_at = datetime.utcnow()
+                    self.created_at = datetime.now(timezone.utc)
             db_turn = MockTurn()
         
         actual_processing_time = (time.time() - process_start) * 1000
         
-        print(f"[ConversationManager] ✅ Transcription error processed in {actual_processing_time:.2f}ms")
-        print(f"[ConversationManager] Raw text skipped: '{raw_text}'")
-        print(f"[ConversationManager] Cleaned text (empty): '{cleaned_text}'")
+        logger.debug("✅ Transcription error processed in %.2fms", actual_processing_time)
+        logger.debug("Raw text skipped: '%s'", raw_text)
+        logger.debug("Cleaned text (empty): '%s'", cleaned_text)
         
         return {
             'turn_id': str(db_turn.id),
@@ -349,28 +435,53 @@ class ConversationManager:
             'created_at': db_turn.created_at.isoformat()
         }
     
-    async def _process_lumen_turn(self, conversation_id: UUID, speaker: str, raw_text: str, 
-                                 conversation_state: ConversationState, db: Session) -> Dict[str, Any]:
+    async def _add_lumen_turn_fast(self, conversation_id: UUID, speaker: str, raw_text: str,
+                                   db: Session) -> Dict[str, Any]:
         """
-        Process Lumen turns with ZERO latency - they're already perfect.
-        Target: < 10ms processing time
+        Persist a Lumen turn with a single INSERT ... RETURNING and nothing else.
+        
+        Unlike the other add_turn paths this never loads the conversation context
+        from the database. If the conversation state is already in memory the turn
+        is appended to it; otherwise the next user turn loads it with the rest of
+        the history.
         """
         process_start = time.time()
-        print(f"[ConversationManager] 🚀 Processing Lumen turn with instant bypass")
+        turn_data = self._lumen_turn_data(conversation_id, speaker, raw_text)
         
-        # Lumen turns are perfect - no cleaning needed
-        cleaned_text = raw_text
-        processing_time_ms = 0  # Conceptually zero processing time
+        # Save to database (with error handling for testing)
+        try:
+            turn_id, created_at = db.execute(
+                insert(Turn).values(id=uuid7(), **turn_data).returning(Turn.id, Turn.created_at)
+            ).one()
+            self._bump_turns_count(db, conversation_id, 1)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning("⚠️ Database error (continuing with mock): %s", e)
+            import uuid
+            turn_id, created_at = uuid.uuid4(), datetime.now(timezone.utc)
         
-        turn_data = {
+        conversation_state = self.active_conversations.get(conversation_id)
+        if conversation_state is not None:
+            conversation_state.add_to_history(turn_data)
+        
+        actual_processing_time = (time.time() - process_start) * 1000
+        self.performance_metrics['lumen_processing_times'].append(actual_processing_time)
+        logger.debug("🚀 Lumen turn stored via fast path in %.2fms", actual_processing_time)
+        
+        return self._lumen_turn_result(turn_id, created_at, turn_data, actual_processing_time)
+    
+    def _lumen_turn_data(self, conversation_id: UUID, speaker: str, raw_text: str) -> Dict[str, Any]:
+        """Build the row for a Lumen turn - they're already perfect, so no cleaning"""
+        return {
             'conversation_id': conversation_id,
             'speaker': speaker,
             'raw_text': raw_text,
-            'cleaned_text': cleaned_text,
+            'cleaned_text': raw_text,
             'confidence_score': 'HIGH',
             'cleaning_applied': False,
             'cleaning_level': 'none',
-            'processing_time_ms': processing_time_ms,
+            'processing_time_ms': 0,  # Conceptually zero processing time
             'corrections': [],
             'context_detected': 'ai_response',
             'ai_model_used': None,
@@ -385,66 +496,78 @@ class ConversationManager:
             'gemini_prompt': None,  # No prompt for Lumen turns
             'gemini_response': None  # No Gemini processing for Lumen turns
         }
+    
+    def _lumen_turn_result(self, turn_id, created_at, turn_data: Dict[str, Any],
+                           processing_time_ms: float) -> Dict[str, Any]:
+        """Shape a stored Lumen turn as an add_turn result"""
+        return {
+            'turn_id': str(turn_id),
+            'conversation_id': str(turn_data['conversation_id']),
+            'speaker': turn_data['speaker'],
+            'raw_text': turn_data['raw_text'],
+            'cleaned_text': turn_data['cleaned_text'],
+            'metadata': {
+                'confidence_score': turn_data['confidence_score'],
+                'cleaning_applied': turn_data['cleaning_applied'],
+                'cleaning_level': turn_data['cleaning_level'],
+                'processing_time_ms': processing_time_ms,
+                'corrections': turn_data['corrections'],
+                'context_detected': turn_data['context_detected'],
+                'ai_model_used': turn_data['ai_model_used']
+            },
+            'created_at': created_at.isoformat()
+        }
+    
+    async def _process_lumen_turn(self, conversation_id: UUID, speaker: str, raw_text: str, 
+                                 conversation_state: ConversationState, db: Session,
+                                 pending_rows: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Process Lumen turns with ZERO latency - they're already perfect.
+        Target: < 10ms processing time
+        """
+        process_start = time.time()
+        logger.debug("🚀 Processing Lumen turn with instant bypass")
+        
+        turn_data = self._lumen_turn_data(conversation_id, speaker, raw_text)
         
         # Add to conversation history
         conversation_state.add_to_history(turn_data)
         
         # Save to database (with error handling for testing)
         try:
-            db_turn = Turn(**turn_data)
-            db.add(db_turn)
-            db.commit()
-            db.refresh(db_turn)
-            
-            # Ensure created_at is available for response (for testing)
-            if not hasattr(db_turn, 'created_at') or db_turn.created_at is None:
-                from datetime import datetime
-                db_turn.created_at = datetime.utcnow()
+            if pending_rows is not None:
+                db_turn = self._queue_turn(turn_data, pending_rows)
+            else:
+                db_turn = self._insert_turn(db, turn_data)
         except Exception as e:
-            print(f"[ConversationManager] ⚠️ Database error (continuing with mock): {e}")
+            logger.warning("⚠️ Database error (continuing with mock): %s", e)
             # Create mock turn for testing when database is unavailable
-            from datetime import datetime
             import uuid
             db_turn = type('MockTurn', (), {
                 'id': uuid.uuid4(),
-                'created_at': datetime.utcnow()
+                'created_at': datetime.now(timezone.utc)
             })()
         
         actual_processing_time = (time.time() - process_start) * 1000
         self.performance_metrics['lumen_processing_times'].append(actual_processing_time)
         
-        print(f"[ConversationManager] ✅ Lumen turn processed in {actual_processing_time:.2f}ms")
-        print(f"[ConversationManager] Cleaning applied: {turn_data['cleaning_applied']}")
-        print(f"[ConversationManager] Added to cleaned history for future context")
+        logger.debug("✅ Lumen turn processed in %.2fms", actual_processing_time)
+        logger.debug("Cleaning applied: %s", turn_data['cleaning_applied'])
+        logger.debug("Added to cleaned history for future context")
         
-        return {
-            'turn_id': str(db_turn.id),
-            'conversation_id': str(conversation_id),
-            'speaker': speaker,
-            'raw_text': raw_text,
-            'cleaned_text': cleaned_text,
-            'metadata': {
-                'confidence_score': turn_data['confidence_score'],
-                'cleaning_applied': turn_data['cleaning_applied'],
-                'cleaning_level': turn_data['cleaning_level'],
-                'processing_time_ms': actual_processing_time,
-                'corrections': turn_data['corrections'],
-                'context_detected': turn_data['context_detected'],
-                'ai_model_used': turn_data['ai_model_used']
-            },
-            'created_at': db_turn.created_at.isoformat()
-        }
+        return self._lumen_turn_result(db_turn.id, db_turn.created_at, turn_data, actual_processing_time)
     
     async def _process_user_turn(self, conversation_id: UUID, speaker: str, raw_text: str,
                                 conversation_state: ConversationState, db: Session, 
-                                cleaning_level: str = "full", model_params: Dict[str, Any] = None) -> Dict[str, Any]:
+                                cleaning_level: str = "full", model_params: Dict[str, Any] = None,
+                                pending_rows: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Process user turns with full CleanerContext intelligence.
         Uses cleaned conversation history as context for better cleaning.
         Target: < 500ms processing time
         """
         process_start = time.time()
-        print(f"[ConversationManager] 👤 Processing user turn with CleanerContext intelligence")
+        logger.debug("👤 Processing user turn with CleanerContext intelligence")
         
         # Initialize timing breakdown
         timing_breakdown = {
@@ -457,54 +580,55 @@ class ConversationManager:
         }
         
         # Get cleaned conversation context (the KEY innovation)
-        print(f"[ConversationManager] 🔍 CONTEXT FLOW DEBUG: About to retrieve cleaned sliding window...")
+        logger.debug("🔍 CONTEXT FLOW DEBUG: About to retrieve cleaned sliding window...")
         context_start = time.time()
         cleaned_context = conversation_state.get_cleaned_sliding_window()
         context_time = (time.time() - context_start) * 1000
         timing_breakdown["context_retrieval_ms"] = round(context_time, 2)
         self.performance_metrics['context_retrieval_times'].append(context_time)
         
-        print(f"[ConversationManager] ✅ CONTEXT FLOW DEBUG: Retrieved cleaned context in {context_time:.2f}ms")
-        print(f"[ConversationManager] 📊 CONTEXT FLOW DEBUG: Context contains {len(cleaned_context)} previous turns")
+        logger.debug("✅ CONTEXT FLOW DEBUG: Retrieved cleaned context in %.2fms", context_time)
+        logger.debug("📊 CONTEXT FLOW DEBUG: Context contains %s previous turns", len(cleaned_context))
         
         # Debug: Log the context that will be passed to prompt building
-        if len(cleaned_context) > 0:
-            print(f"[ConversationManager] 📋 CONTEXT FLOW DEBUG: Context being passed to prompt:")
-            for i, turn in enumerate(cleaned_context):
-                print(f"[ConversationManager]   Context[{i}]: {turn['speaker']} - '{turn['cleaned_text'][:80]}...'")
-        else:
-            print(f"[ConversationManager] ❌ CONTEXT FLOW DEBUG: NO CONTEXT available for prompt!")
+        if logger.isEnabledFor(logging.DEBUG):
+            if len(cleaned_context) > 0:
+                logger.debug("📋 CONTEXT FLOW DEBUG: Context being passed to prompt:")
+                for i, turn in enumerate(cleaned_context):
+                    logger.debug("Context[%s]: %s - '%s...'", i, turn['speaker'], turn['cleaned_text'][:80])
+            else:
+                logger.debug("❌ CONTEXT FLOW DEBUG: NO CONTEXT available for prompt!")
         
         # Use provided cleaning level or analyze for decision
         if cleaning_level == "auto":
-            print(f"[ConversationManager] 🧠 Analyzing turn for cleaning decision...")
+            logger.debug("🧠 Analyzing turn for cleaning decision...")
             cleaning_decision = self._analyze_cleaning_need(raw_text)
-            print(f"[ConversationManager] Decision: {cleaning_decision}")
+            logger.debug("Decision: %s", cleaning_decision)
         else:
             cleaning_decision = cleaning_level
-            print(f"[ConversationManager] Using provided cleaning level: {cleaning_decision}")
+            logger.debug("Using provided cleaning level: %s", cleaning_decision)
         
         # Get active prompt template for processing (or use default)
         prompt_start = time.time()
         rendered_prompt_text = None
         try:
             active_template = await self.prompt_service.get_or_create_default_template(db)
-            print(f"[ConversationManager] Using prompt template: {active_template.name}")
+            logger.debug("Using prompt template: %s", active_template.name)
             
             # Build variables for prompt
-            print(f"[ConversationManager] 🔍 PROMPT BUILD DEBUG: Building context string for prompt template...")
+            logger.debug("🔍 PROMPT BUILD DEBUG: Building context string for prompt template...")
             context_str = ""
             if cleaned_context:
-                print(f"[ConversationManager] 📊 PROMPT BUILD DEBUG: Using {len(cleaned_context)} turns for context")
+                logger.debug("📊 PROMPT BUILD DEBUG: Using %s turns for context", len(cleaned_context))
                 context_lines = []
                 for turn in cleaned_context[-5:]:  # Last 5 turns
                     line = f"{turn['speaker']}: {turn['cleaned_text']}"
                     context_lines.append(line)
-                    print(f"[ConversationManager]   → Context line: {line[:100]}...")
+                    logger.debug("→ Context line: %s...", line[:100])
                 context_str = "\n".join(context_lines)
-                print(f"[ConversationManager] ✅ PROMPT BUILD DEBUG: Built context string ({len(context_str)} chars)")
+                logger.debug("✅ PROMPT BUILD DEBUG: Built context string (%s chars)", len(context_str))
             else:
-                print(f"[ConversationManager] ❌ PROMPT BUILD DEBUG: No context available for prompt template!")
+                logger.debug("❌ PROMPT BUILD DEBUG: No context available for prompt template!")
             
             variables = {
                 "conversation_context": context_str,
@@ -512,20 +636,20 @@ class ConversationManager:
                 "cleaning_level": cleaning_decision
             }
             
-            print(f"[ConversationManager] 📋 PROMPT BUILD DEBUG: Template variables:")
-            print(f"[ConversationManager]   → conversation_context: {len(context_str)} chars")
-            print(f"[ConversationManager]   → raw_text: '{raw_text[:50]}...'")
-            print(f"[ConversationManager]   → cleaning_level: {cleaning_decision}")
+            logger.debug("📋 PROMPT BUILD DEBUG: Template variables:")
+            logger.debug("→ conversation_context: %s chars", len(context_str))
+            logger.debug("→ raw_text: '%s...'", raw_text[:50])
+            logger.debug("→ cleaning_level: %s", cleaning_decision)
             
             # Render the prompt
             rendered_prompt = await self.prompt_service.render_prompt(db, active_template.id, variables)
             if rendered_prompt:
-                print(f"[ConversationManager] Rendered prompt with {len(variables)} variables")
-                print(f"[ConversationManager] Estimated tokens: {rendered_prompt.token_count}")
+                logger.debug("Rendered prompt with %s variables", len(variables))
+                logger.debug("Estimated tokens: %s", rendered_prompt.token_count)
                 rendered_prompt_text = rendered_prompt.rendered_prompt
             
         except Exception as e:
-            print(f"[ConversationManager] ⚠️ Prompt service error: {e}")
+            logger.warning("⚠️ Prompt service error: %s", e)
             rendered_prompt = None
             active_template = None
             rendered_prompt_text = None
@@ -534,25 +658,25 @@ class ConversationManager:
         timing_breakdown["prompt_preparation_ms"] = round(prompt_time, 2)
 
         # Use Gemini 2.5 Flash for actual cleaning
-        print(f"[ConversationManager] 🤖 Applying {cleaning_decision} cleaning with Gemini...")
+        logger.debug("🤖 Applying %s cleaning with Gemini...", cleaning_decision)
         if model_params:
-            print(f"[ConversationManager] Using custom model params: {model_params}")
+            logger.debug("Using custom model params: %s", model_params)
         
         gemini_start = time.time()
         try:
-            print(f"[ConversationManager] Calling Gemini service for {speaker} turn...")
+            logger.debug("Calling Gemini service for %s turn...", speaker)
             
             # Add progress monitoring for long API calls
             async def progress_monitor():
                 await asyncio.sleep(10)  # Wait 10 seconds
                 if time.time() - gemini_start > 10:
-                    print(f"[ConversationManager] ⏳ Gemini call still running after 10s...")
+                    logger.debug("⏳ Gemini call still running after 10s...")
                 await asyncio.sleep(20)  # Wait another 20 seconds  
                 if time.time() - gemini_start > 30:
-                    print(f"[ConversationManager] ⏳ Gemini call still running after 30s...")
+                    logger.debug("⏳ Gemini call still running after 30s...")
                 await asyncio.sleep(30)  # Wait another 30 seconds
                 if time.time() - gemini_start > 60:
-                    print(f"[ConversationManager] ⚠️ Gemini call taking very long (60s+)...")
+                    logger.warning("⚠️ Gemini call taking very long (60s+)...")
             
             # Start progress monitor
             monitor_task = asyncio.create_task(progress_monitor())
@@ -572,7 +696,7 @@ class ConversationManager:
             
             gemini_time = (time.time() - gemini_start) * 1000
             timing_breakdown["gemini_api_ms"] = round(gemini_time, 2)
-            print(f"[ConversationManager] ✅ Gemini processing completed in {gemini_time:.2f}ms")
+            logger.debug("✅ Gemini processing completed in %.2fms", gemini_time)
             
         except Exception as e:
             gemini_time = (time.time() - gemini_start) * 1000
@@ -580,13 +704,13 @@ class ConversationManager:
             
             # Enhanced logging for timeouts
             if "TimeoutError" in str(type(e).__name__):
-                print(f"[ConversationManager] 🚨 CRITICAL TIMEOUT: Gemini API timed out after {gemini_time:.2f}ms")
-                print(f"[ConversationManager] 🚨 TIMEOUT CONTEXT: {speaker} turn, {len(raw_text)} chars")
-                print(f"[ConversationManager] 🚨 TEXT PREVIEW: '{raw_text[:200]}...'")
-                logger.error(f"🚨 CRITICAL: Gemini timeout in conversation {conversation_id}")
-                logger.error(f"🚨 TIMEOUT TURN: {speaker} - {len(raw_text)} chars - {raw_text[:100]}...")
+                logger.debug("🚨 CRITICAL TIMEOUT: Gemini API timed out after %.2fms", gemini_time)
+                logger.debug("🚨 TIMEOUT CONTEXT: %s turn, %s chars", speaker, len(raw_text))
+                logger.debug("🚨 TEXT PREVIEW: '%s...'", raw_text[:200])
+                logger.error("🚨 CRITICAL: Gemini timeout in conversation %s", conversation_id)
+                logger.error("🚨 TIMEOUT TURN: %s - %s chars - %s...", speaker, len(raw_text), raw_text[:100])
             else:
-                print(f"[ConversationManager] ❌ Gemini processing failed after {gemini_time:.2f}ms: {e}")
+                logger.error("❌ Gemini processing failed after %.2fms: %s", gemini_time, e)
             
             # Create fallback result when Gemini fails
             error_type = "timeout_3s" if "TimeoutError" in str(type(e).__name__) else str(type(e).__name__)
@@ -604,7 +728,7 @@ class ConversationManager:
                 },
                 "raw_response": None
             }
-            print(f"[ConversationManager] Using fallback response for {speaker} turn due to {error_type}")
+            logger.debug("Using fallback response for %s turn due to %s", speaker, error_type)
         
         # Calculate final timing before creating turn_data
         processing_time_ms = (time.time() - process_start) * 1000
@@ -623,9 +747,9 @@ class ConversationManager:
         timing_breakdown["prompt_logging_ms"] = 0  # Will be updated after prompt logging
         timing_breakdown["total_ms"] = round(component_sum, 2)  # Use component sum, not wall clock time
         
-        print(f"[ConversationManager] 🔍 TIMING FIX DEBUG: Final timing_breakdown before DB save: {timing_breakdown}")
-        print(f"[ConversationManager] 📊 TIMING FIX DEBUG: timing_breakdown keys: {list(timing_breakdown.keys())}")
-        print(f"[ConversationManager] 📊 TIMING FIX DEBUG: timing_breakdown length: {len(timing_breakdown)}")
+        logger.debug("🔍 TIMING FIX DEBUG: Final timing_breakdown before DB save: %s", timing_breakdown)
+        logger.debug("📊 TIMING FIX DEBUG: timing_breakdown keys: %s", list(timing_breakdown.keys()))
+        logger.debug("📊 TIMING FIX DEBUG: timing_breakdown length: %s", len(timing_breakdown))
         
         # Create a copy of timing_breakdown to avoid reference issues
         timing_breakdown_copy = timing_breakdown.copy()
@@ -651,80 +775,57 @@ class ConversationManager:
         conversation_state.add_to_history(turn_data)
         
         # Save to database (with error handling for testing)
-        print(f"[ConversationManager] 🔍 DB SAVE DEBUG: Preparing to save turn to database...")
-        print(f"[ConversationManager] 📊 DB SAVE DEBUG: timing_breakdown data: {timing_breakdown}")
-        print(f"[ConversationManager] 🔍 DB SAVE DEBUG: timing_breakdown type: {type(timing_breakdown)}")
+        logger.debug("🔍 DB SAVE DEBUG: Preparing to save turn to database...")
+        logger.debug("📊 DB SAVE DEBUG: timing_breakdown data: %s", timing_breakdown)
+        logger.debug("🔍 DB SAVE DEBUG: timing_breakdown type: %s", type(timing_breakdown))
         
         db_start = time.time()
-        try:
-            print(f"[ConversationManager] 💾 DB SAVE DEBUG: Creating Turn object with turn_data...")
-            
-            # Debug database configuration
-            from app.core.config import settings
-            print(f"[ConversationManager] 🔍 DB CONFIG DEBUG: DATABASE_URL: {settings.DATABASE_URL[:60]}...{settings.DATABASE_URL[-20:]}")
-            print(f"[ConversationManager] 🔍 DB CONFIG DEBUG: Database session type: {type(db)}")
-            
-            # Debug the turn_data before saving
-            print(f"[ConversationManager] 📋 DB SAVE DEBUG: turn_data keys: {list(turn_data.keys())}")
-            print(f"[ConversationManager] 📊 DB SAVE DEBUG: turn_data.timing_breakdown: {turn_data.get('timing_breakdown', 'NOT_SET')}")
-            print(f"[ConversationManager] 🔍 DB SAVE DEBUG: timing_breakdown type: {type(turn_data.get('timing_breakdown'))}")
-            print(f"[ConversationManager] 📊 DB SAVE DEBUG: timing_breakdown contents: {turn_data.get('timing_breakdown')}")
-            
-            db_turn = Turn(**turn_data)
-            
-            # Immediately check what got saved to the object
-            print(f"[ConversationManager] 🔍 DB SAVE DEBUG: IMMEDIATELY after Turn creation:")
-            print(f"[ConversationManager] 📊 DB SAVE DEBUG: db_turn.timing_breakdown: {db_turn.timing_breakdown}")
-            print(f"[ConversationManager] 📊 DB SAVE DEBUG: db_turn.timing_breakdown type: {type(db_turn.timing_breakdown)}")
-            print(f"[ConversationManager] 📊 DB SAVE DEBUG: db_turn.timing_breakdown keys: {list(db_turn.timing_breakdown.keys()) if db_turn.timing_breakdown else 'None'}")
-            
-            print(f"[ConversationManager] ✅ DB SAVE DEBUG: Turn object created successfully")
-            print(f"[ConversationManager] 📊 DB SAVE DEBUG: db_turn.timing_breakdown: {getattr(db_turn, 'timing_breakdown', 'NOT_SET')}")
-            
-            # Explicitly mark the timing_breakdown as modified for SQLAlchemy
-            from sqlalchemy.orm.attributes import flag_modified
-            flag_modified(db_turn, 'timing_breakdown')
-            
-            db.add(db_turn)
-            db.commit()
+        if pending_rows is not None:
+            db_turn = self._queue_turn(turn_data, pending_rows)
+        else:
+            try:
+                debug = logger.isEnabledFor(logging.DEBUG)
+                if debug:
+                    logger.debug("💾 DB SAVE DEBUG: Creating Turn object with turn_data...")
+                    
+                    # Debug database configuration
+                    from app.core.config import settings
+                    logger.debug("🔍 DB CONFIG DEBUG: DATABASE_URL: %s...%s", settings.DATABASE_URL[:60], settings.DATABASE_URL[-20:])
+                    logger.debug("🔍 DB CONFIG DEBUG: Database session type: %s", type(db))
+                    
+                    # Debug the turn_data before saving
+                    logger.debug("📋 DB SAVE DEBUG: turn_data keys: %s", list(turn_data.keys()))
+                    logger.debug("📊 DB SAVE DEBUG: turn_data.timing_breakdown: %s", turn_data.get('timing_breakdown', 'NOT_SET'))
             
-            # Calculate database save time and update timing breakdown
-            db_time = (time.time() - db_start) * 1000
-            timing_breakdown["database_save_ms"] = round(db_time, 2)
+                db_turn = self._insert_turn(db, turn_data)
             
-            # Ensure created_at is available for response
-            if not hasattr(db_turn, 'created_at') or db_turn.created_at is None:
-                from datetime import datetime
-                db_turn.created_at = datetime.utcnow()
+                # Calculate database save time and update timing breakdown
+                db_time = (time.time() - db_start) * 1000
+                timing_breakdown["database_save_ms"] = round(db_time, 2)
                 
-            print(f"[ConversationManager] ⏱️ DB SAVE DEBUG: Database save took {db_time:.2f}ms")
+                logger.debug("⏱️ DB SAVE DEBUG: Database save took %.2fms", db_time)
                 
-        except Exception as e:
-            print(f"[ConversationManager] ❌ CRITICAL DB ERROR: {e}")
-            print(f"[ConversationManager] ❌ CRITICAL ERROR TYPE: {type(e).__name__}")
-            print(f"[ConversationManager] ❌ CRITICAL ERROR DETAILS: {str(e)}")
-            
-            # Print the exact turn_data that's causing the issue
-            print(f"[ConversationManager] 🔍 PROBLEMATIC TURN DATA:")
-            for key, value in turn_data.items():
-                print(f"[ConversationManager]   {key}: {type(value)} = {str(value)[:100]}...")
-            
-            import traceback
-            print(f"[ConversationManager] ❌ FULL TRACEBACK:")
-            traceback.print_exc()
-            print(f"[ConversationManager] ⚠️ Database error (continuing with mock): {e}")
-            # Create mock turn for testing when database is unavailable
-            from datetime import datetime
-            import uuid
-            db_turn = type('MockTurn', (), {
-                'id': uuid.uuid4(),
-                'created_at': datetime.utcnow(),
-                'timing_breakdown': {},  # Empty timing for mock
-                'processing_time_ms': 0   # Zero processing time for mock
-            })()
-            print(f"[ConversationManager] 🔧 DB SAVE DEBUG: Created mock turn for fallback")
-            db_time = (time.time() - db_start) * 1000
-            timing_breakdown["database_save_ms"] = round(db_time, 2)
+            except Exception as e:
+                logger.error("❌ CRITICAL DB ERROR: %s", e, exc_info=True)
+            
+                # Log the exact turn_data that's causing the issue
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("🔍 PROBLEMATIC TURN DATA:")
+                    for key, value in turn_data.items():
+                        logger.debug("%s: %s = %s...", key, type(value), str(value)[:100])
+            
+                logger.warning("⚠️ Database error (continuing with mock): %s", e)
+                # Create mock turn for testing when database is unavailable
+                import uuid
+                db_turn = type('MockTurn', (), {
+                    'id': uuid.uuid4(),
+                    'created_at': datetime.now(timezone.utc),
+                    'timing_breakdown': {},  # Empty timing for mock
+                    'processing_time_ms': 0   # Zero processing time for mock
+                })()
+                logger.debug("🔧 DB SAVE DEBUG: Created mock turn for fallback")
+                db_time = (time.time() - db_start) * 1000
+                timing_breakdown["database_save_ms"] = round(db_time, 2)
         
         # Log prompt usage for analytics
         prompt_log_start = time.time()
@@ -739,11 +840,13 @@ class ConversationManager:
                     conversation_id=conversation_id,
                     processing_time_ms=processing_time_ms,
                     confidence_score=turn_data['confidence_score'],
-                    corrections_count=len(turn_data['corrections'])
+                    corrections_count=len(turn_data['corrections']),
+                    # A queued turn isn't stored yet; its usage row commits with the batch
+                    commit=pending_rows is None
                 )
-                print(f"[ConversationManager] ✅ Logged prompt usage for analytics")
+                logger.debug("✅ Logged prompt usage for analytics")
             except Exception as e:
-                print(f"[ConversationManager] ⚠️ Failed to log prompt usage: {e}")
+                logger.warning("⚠️ Failed to log prompt usage: %s", e)
         prompt_log_time = (time.time() - prompt_log_start) * 1000
         timing_breakdown["prompt_logging_ms"] = round(prompt_log_time, 2)
         
@@ -757,11 +860,11 @@ class ConversationManager:
         )
         timing_breakdown["total_ms"] = round(final_total, 2)
 
-        print(f"[ConversationManager] ✅ User turn processed in {processing_time_ms:.2f}ms")
-        print(f"[ConversationManager] 📊 Final timing breakdown: {timing_breakdown}")
-        print(f"[ConversationManager] Cleaning applied: {turn_data['cleaning_applied']}")
-        print(f"[ConversationManager] Confidence: {turn_data['confidence_score']}")
-        print(f"[ConversationManager] Corrections made: {len(turn_data['corrections'])}")
+        logger.debug("✅ User turn processed in %.2fms", processing_time_ms)
+        logger.debug("📊 Final timing breakdown: %s", timing_breakdown)
+        logger.debug("Cleaning applied: %s", turn_data['cleaning_applied'])
+        logger.debug("Confidence: %s", turn_data['confidence_score'])
+        logger.debug("Corrections made: %s", len(turn_data['corrections']))
         
         return {
             'turn_id': str(db_turn.id),
@@ -788,7 +891,7 @@ class ConversationManager:
         """
         Analyze text to determine optimal cleaning level
         """
-        print(f"[ConversationManager] 🔍 Analyzing text for cleaning patterns...")
+        logger.debug("🔍 Analyzing text for cleaning patterns...")
         
         # Simple pattern detection
         text_lower = raw_text.lower()
@@ -796,7 +899,7 @@ class ConversationManager:
         # Check for simple acknowledgments (no cleaning needed)
         simple_responses = ['yes', 'no', 'ok', 'okay', 'right', 'correct', 'exactly', 'sure', 'yep', 'nope']
         if text_lower.strip() in simple_responses:
-            print(f"[ConversationManager] Pattern: Simple acknowledgment detected")
+            logger.debug("Pattern: Simple acknowledgment detected")
             return 'none'
         
         # Check for obvious STT error indicators
@@ -811,23 +914,23 @@ class ConversationManager:
         
         # Check for very short responses (likely need minimal cleaning)
         if len(raw_text.strip()) < 10:
-            print(f"[ConversationManager] Pattern: Very short response")
+            logger.debug("Pattern: Very short response")
             return 'light'
         
         # Check for obvious errors or artifacts
         if has_errors or '  ' in raw_text or raw_text.count('.') > 3:
-            print(f"[ConversationManager] Pattern: STT errors/artifacts detected")
+            logger.debug("Pattern: STT errors/artifacts detected")
             return 'full'
         
         # Default to light cleaning for normal conversation
-        print(f"[ConversationManager] Pattern: Normal conversation - light cleaning")
+        logger.debug("Pattern: Normal conversation - light cleaning")
         return 'light'
     
     def _simulate_cleaning_process(self, raw_text: str, context: List[Dict], decision: str) -> Dict[str, Any]:
         """
         Simulate the cleaning process (will be replaced with AI in Day 8)
         """
-        print(f"[ConversationManager] 🛠️ Simulating {decision} cleaning process...")
+        logger.debug("🛠️ Simulating %s cleaning process...", decision)
         
         if decision == 'none':
             return {
@@ -863,9 +966,9 @@ class ConversationManager:
         cleaning_applied = len(corrections) > 0
         confidence = 'HIGH' if cleaning_applied else 'MEDIUM'
         
-        print(f"[ConversationManager] Applied {len(corrections)} corrections")
+        logger.debug("Applied %s corrections", len(corrections))
         for correction in corrections:
-            print(f"[ConversationManager] Correction: '{correction['original']}' -> '{correction['corrected']}'")
+            logger.debug("Correction: '%s' -> '%s'", correction['original'], correction['corrected'])
         
         return {
             'cleaned_text': cleaned_text,
@@ -895,5 +998,9 @@ class ConversationManager:
                     'count': 0
                 }
         
-        print(f"[ConversationManager] Performance metrics: {metrics}")
-        return metrics
\ No newline at end of file
+        logger.debug("Performance metrics: %s", metrics)
+        return metrics
+
+# Singleton instance for app-wide use, so every router shares one set of
+# in-memory conversation states and one Gemini client
+conversation_manager = ConversationManager()
@@ -93,7 +93,7 @@ class GeminiService:
         """
         start_time = time.time()
         
-        logger.info(f"Cleaning {speaker} turn: '{raw_text[:50]}...' (level: {cleaning_level})")
+        logger.debug("Cleaning %s turn: '%s...' (level: %s)", speaker, raw_text[:50], cleaning_level)
         
         # Skip processing for Lumen turns (they're already perfect)
         if speaker == "Lumen" or speaker == "AI":
@@ -133,7 +133,7 @@ class GeminiService:
         
         try:
             # Enhanced logging for debugging hangs
-            logger.info(f"Starting Gemini API call for {speaker} turn")
+            logger.debug("Starting Gemini API call for %s turn", speaker)
             api_start = time.time()
             
             # Use custom model parameters if provided
@@ -154,15 +154,15 @@ class GeminiService:
                     safety_settings=self.safety_settings
                 )
                 
-                logger.info(f"Using custom model params: {custom_config}")
+                logger.debug("Using custom model params: %s", custom_config)
                 response = await self._call_gemini_with_timeout(custom_model, prompt, timeout_seconds=3)
             else:
                 # Use default model
-                logger.info(f"Using default model configuration")
+                logger.debug("Using default model configuration")
                 response = await self._call_gemini_with_timeout(self.model, prompt, timeout_seconds=3)
             
             api_time = round((time.time() - api_start) * 1000, 2)
-            logger.info(f"Gemini API call completed in {api_time}ms")
+            logger.debug("Gemini API call completed in %sms", api_time)
             
             # Validate response
             if not response or not response.text:
@@ -170,7 +170,7 @@ class GeminiService:
                 return self._fallback_response(raw_text, start_time, "empty_response")
             
             # Parse JSON response
-            logger.info(f"Parsing Gemini response: {response.text[:200]}...")
+            logger.debug("Parsing Gemini response: %s...", response.text[:200])
             result = json.loads(response.text)
             
             processing_time = round((time.time() - start_time) * 1000, 2)
@@ -191,14 +191,12 @@ class GeminiService:
                 "prompt_used": prompt  # Store the actual prompt that was sent to Gemini
             }
             
-            logger.info(f"Cleaned in {processing_time}ms, confidence: {cleaned_response['metadata']['confidence_score']}")
+            logger.debug("Cleaned in %sms, confidence: %s", processing_time, cleaned_response['metadata']['confidence_score'])
             return cleaned_response
             
         except asyncio.TimeoutError:
             logger.error(f"🚨 GEMINI API TIMEOUT: Call timed out after 3 seconds for {speaker} turn")
             logger.error(f"🚨 TIMEOUT DETAILS: Raw text length: {len(raw_text)} chars, Speaker: {speaker}")
-            print(f"[GeminiService] 🚨 CRITICAL: Gemini API timeout after 3 seconds!")
-            print(f"[GeminiService] 🚨 Turn details: {speaker} - '{raw_text[:100]}...'")
             return self._fallback_response(raw_text, start_time, "api_timeout_3s")
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse Gemini JSON response: {e}")
@@ -279,7 +277,6 @@ IMPORTANT:
             
         except asyncio.TimeoutError:
             logger.error(f"🚨 GEMINI TIMEOUT: API call exceeded {timeout_seconds}s limit")
-            print(f"[GeminiService] 🚨 API TIMEOUT: {timeout_seconds}s exceeded")
             raise
         except Exception as e:
             logger.error(f"Gemini API call failed: {e}")
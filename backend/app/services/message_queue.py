@@ -9,7 +9,7 @@ import asyncio
 import json
 import time
 from typing import Dict, List, Optional, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import UUID
 import uuid
 import logging
@@ -177,7 +177,7 @@ class MessageQueueManager:
             speaker=speaker,
             raw_text=raw_text,
             priority=priority,
-            created_at=datetime.utcnow()
+            created_at=datetime.now(timezone.utc)
         )
         
         try:
@@ -192,8 +192,8 @@ class MessageQueueManager:
             self.metrics.total_jobs += 1
             enqueue_time = (time.time() - start_time) * 1000
             
-            logger.info(f"[MessageQueue] Enqueued job {job.job_id} in {enqueue_time:.2f}ms")
-            logger.info(f"   Speaker: {speaker} | Priority: {priority} | Text: {raw_text[:50]}...")
+            logger.info("[MessageQueue] Enqueued job %s in %.2fms", job.job_id, enqueue_time)
+            logger.debug("   Speaker: %s | Priority: %s | Text: %s...", speaker, priority, raw_text[:50])
             
             # Performance warning
             if enqueue_time > 50:
@@ -292,8 +292,8 @@ class MessageQueueManager:
         """Process a cleaning job with performance tracking"""
         start_time = time.time()
         
-        logger.info(f"[{worker_name}] Processing job {job.job_id}")
-        logger.info(f"   Speaker: {job.speaker} | Priority: {job.priority}")
+        logger.info("[%s] Processing job %s", worker_name, job.job_id)
+        logger.debug("   Speaker: %s | Priority: %s", job.speaker, job.priority)
         
         try:
             # Import here to avoid circular import
@@ -317,7 +317,7 @@ class MessageQueueManager:
                 
                 # Update metrics
                 self.metrics.processed_jobs += 1
-                self.metrics.last_processed = datetime.utcnow()
+                self.metrics.last_processed = datetime.now(timezone.utc)
                 self.processing_times.append(processing_time)
                 
                 # Keep only last 100 measurements
@@ -330,8 +330,9 @@ class MessageQueueManager:
                     processing_time
                 )
                 
-                logger.info(f"[{worker_name}] ✅ Job completed in {processing_time:.2f}ms")
-                logger.info(f"   Result: {result.metadata.cleaning_level} cleaning, {result.metadata.confidence_score} confidence")
+                logger.info("[%s] ✅ Job completed in %.2fms", worker_name, processing_time)
+                logger.debug("   Result: %s cleaning, %s confidence",
+                             result['metadata']['cleaning_level'], result['metadata']['confidence_score'])
                 
                 # Acknowledge job completion
                 await self._ack_job(job.job_id)
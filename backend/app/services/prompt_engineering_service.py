@@ -9,7 +9,7 @@ import logging
 from typing import Dict, List, Any, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, insert, update
 
 from app.models.prompt_template import PromptTemplate, PromptUsage, ABTest, ABTestResult
 from app.schemas.prompt import (
@@ -23,10 +23,32 @@ from app.schemas.prompt import (
 
 logger = logging.getLogger(__name__)
 
+# The default template is read on every cleaned turn but rarely edited
+DEFAULT_TEMPLATE_CACHE_TTL_SECONDS = 30
+DEFAULT_TEMPLATE_NAME = "Default CleanerContext Template"
+
+TEMPLATE_COLUMNS = frozenset(PromptTemplate.__table__.columns.keys())
+
+
+def _snapshot(model: Any, source: Any) -> Any:
+    """Build a session-free model instance from any object exposing its columns"""
+    return model(**{key: getattr(source, key) for key in model.__table__.columns.keys()})
+
+
+def _insert_returning(db: Session, model: Any, **values) -> Any:
+    """INSERT one row and build it from RETURNING, so no refresh SELECT follows the commit"""
+    row = db.execute(insert(model).values(**values).returning(*model.__table__.columns)).one()
+    db.commit()
+    return _snapshot(model, row)
+
 
 class PromptEngineeringService:
     """Service for managing prompt templates, A/B testing, and analytics"""
     
+    # (cache expiry timestamp, detached template snapshot), shared by every
+    # instance so edits made through the API invalidate the cleaning path too
+    _default_template_cache: Optional[Tuple[float, PromptTemplate]] = None
+    
     def __init__(self):
         logger.info("Initialized Prompt Engineering Service")
         
@@ -68,13 +90,17 @@ IMPORTANT:
 
     async def get_or_create_default_template(self, db: Session) -> PromptTemplate:
         """Get the default template or create it if it doesn't exist"""
+        cached = self._cached_default_template()
+        if cached is not None:
+            return cached
+        
         template = db.query(PromptTemplate).filter(
-            PromptTemplate.name == "Default CleanerContext Template"
+            PromptTemplate.name == DEFAULT_TEMPLATE_NAME
         ).first()
         
         if not template:
             template = PromptTemplate(
-                name="Default CleanerContext Template",
+                name=DEFAULT_TEMPLATE_NAME,
                 template=self.default_template,
                 description="The original system prompt for conversation cleaning",
                 variables=["conversation_context", "raw_text", "cleaning_level"],
@@ -86,8 +112,23 @@ IMPORTANT:
             db.refresh(template)
             logger.info(f"Created default prompt template: {template.id}")
         
+        # Cache a session-free copy so later requests never touch an expired instance
+        PromptEngineeringService._default_template_cache = (
+            time.time() + DEFAULT_TEMPLATE_CACHE_TTL_SECONDS, _snapshot(PromptTemplate, template)
+        )
         return template
 
+    def _cached_default_template(self) -> Optional[PromptTemplate]:
+        """Return the cached default template snapshot if it has not expired"""
+        cached = PromptEngineeringService._default_template_cache
+        if cached is not None and cached[0] > time.time():
+            return cached[1]
+        return None
+
+    def invalidate_default_template_cache(self) -> None:
+        """Drop the cached default template after any template write"""
+        PromptEngineeringService._default_template_cache = None
+
     async def create_template(self, db: Session, name: str, template: str, 
                             description: Optional[str] = None,
                             variables: Optional[List[str]] = None) -> PromptTemplate:
@@ -97,17 +138,15 @@ IMPORTANT:
         if variables is None:
             variables = self._extract_variables(template)
         
-        db_template = PromptTemplate(
+        db_template = _insert_returning(
+            db, PromptTemplate,
             name=name,
             template=template,
             description=description,
             variables=variables,
             version="1.0.0"
         )
-        
-        db.add(db_template)
-        db.commit()
-        db.refresh(db_template)
+        self.invalidate_default_template_cache()
         
         logger.info(f"Created prompt template: {name} ({db_template.id})")
         return db_template
@@ -138,44 +177,66 @@ IMPORTANT:
     async def update_template(self, db: Session, template_id: UUID, 
                             **updates) -> Optional[PromptTemplate]:
         """Update a prompt template"""
-        template = await self.get_template(db, template_id)
-        if not template:
-            return None
-        
-        for key, value in updates.items():
-            if hasattr(template, key) and value is not None:
-                setattr(template, key, value)
+        values = {
+            key: value for key, value in updates.items()
+            if key in TEMPLATE_COLUMNS and key != 'id' and value is not None
+        }
+        if not values:
+            return await self.get_template(db, template_id)
         
         # Re-extract variables if template was updated
-        if 'template' in updates:
-            template.variables = self._extract_variables(template.template)
+        if 'template' in values:
+            values['variables'] = self._extract_variables(values['template'])
+        
+        # One UPDATE ... RETURNING instead of SELECT, UPDATE and a refresh SELECT
+        row = db.execute(
+            update(PromptTemplate)
+            .where(PromptTemplate.id == template_id)
+            .values(**values)
+            .returning(*PromptTemplate.__table__.columns)
+        ).first()
+        if row is None:
+            db.rollback()
+            return None
         
         db.commit()
-        db.refresh(template)
+        self.invalidate_default_template_cache()
         
+        template = _snapshot(PromptTemplate, row)
         logger.info(f"Updated template: {template.name}")
         return template
 
     async def set_active_template(self, db: Session, template_id: UUID) -> bool:
         """Set a template as the active one (deactivate others)"""
-        # Deactivate all templates
-        db.query(PromptTemplate).update({PromptTemplate.is_active: False})
-        
-        # Activate the selected template
-        template = await self.get_template(db, template_id)
-        if not template:
+        # Activate the selected row first; RETURNING tells us whether it exists
+        name = db.execute(
+            update(PromptTemplate)
+            .where(PromptTemplate.id == template_id)
+            .values(is_active=True)
+            .returning(PromptTemplate.name)
+        ).scalar()
+        if name is None:
+            db.rollback()
             return False
         
-        template.is_active = True
+        # Only rows that are actually active need touching
+        db.execute(
+            update(PromptTemplate)
+            .where(PromptTemplate.is_active, PromptTemplate.id != template_id)
+            .values(is_active=False)
+        )
         db.commit()
+        self.invalidate_default_template_cache()
         
-        logger.info(f"Set active template: {template.name}")
+        logger.info(f"Set active template: {name}")
         return True
 
     async def render_prompt(self, db: Session, template_id: UUID, 
                           variables: Dict[str, Any]) -> Optional[RenderedPrompt]:
         """Render a prompt with given variables"""
-        template = await self.get_template(db, template_id)
+        template = self._cached_default_template()
+        if template is None or template.id != template_id:
+            template = await self.get_template(db, template_id)
         if not template:
             return None
         
@@ -215,8 +276,13 @@ IMPORTANT:
                              conversation_id: Optional[UUID] = None,
                              processing_time_ms: Optional[float] = None,
                              confidence_score: Optional[str] = None,
-                             corrections_count: int = 0) -> PromptUsage:
-        """Log usage of a prompt template"""
+                             corrections_count: int = 0, commit: bool = True) -> PromptUsage:
+        """
+        Log usage of a prompt template.
+        
+        With commit=False the row is only added to the session, so it is stored
+        or rolled back together with the caller's transaction.
+        """
         
         usage = PromptUsage(
             template_id=template_id,
@@ -231,23 +297,23 @@ IMPORTANT:
             context_turns_used=len(variables.get('conversation_context', '').split('\n')) if 'conversation_context' in variables else 0
         )
         
+        # The caller only fires and forgets, so skip the refresh SELECT
         db.add(usage)
-        db.commit()
-        db.refresh(usage)
+        if commit:
+            db.commit()
         
         return usage
 
     async def get_turn_prompt_analysis(self, db: Session, turn_id: UUID) -> Optional[TurnPromptAnalysis]:
         """Get detailed prompt analysis for a specific turn"""
         
-        # Get the prompt usage for this turn
-        usage = db.query(PromptUsage).filter(PromptUsage.turn_id == turn_id).first()
-        if not usage:
-            return None
-        
-        template = await self.get_template(db, usage.template_id)
-        if not template:
+        # Fetch the prompt usage for this turn together with its template
+        row = db.query(PromptUsage, PromptTemplate).join(
+            PromptTemplate, PromptTemplate.id == PromptUsage.template_id
+        ).filter(PromptUsage.turn_id == turn_id).first()
+        if not row:
             return None
+        usage, template = row
         
         # This would need to be filled from the actual turn data
         # For now, we'll return a mock structure
@@ -276,11 +342,19 @@ IMPORTANT:
                                      template_id: UUID) -> PromptPerformanceMetrics:
         """Get performance metrics for a template"""
         
-        usages = db.query(PromptUsage).filter(
-            PromptUsage.template_id == template_id
-        ).all()
-        
-        if not usages:
+        # Aggregate in the database in one pass instead of loading every usage
+        # row (rendered prompt and variables included) to count in Python
+        (total_uses, avg_processing_time, confidence_count, high_confidence,
+         corrected_uses, context_uses) = db.query(
+            func.count(PromptUsage.id),
+            func.avg(func.nullif(PromptUsage.processing_time_ms, 0)),
+            func.count(func.nullif(PromptUsage.confidence_score, "")),
+            func.count(PromptUsage.id).filter(PromptUsage.confidence_score == "HIGH"),
+            func.count(PromptUsage.id).filter(PromptUsage.corrections_count > 0),
+            func.count(PromptUsage.id).filter(PromptUsage.context_turns_used > 0)
+        ).filter(PromptUsage.template_id == template_id).one()
+        
+        if not total_uses:
             return PromptPerformanceMetrics(
                 template_id=str(template_id),
                 total_uses=0,
@@ -291,20 +365,13 @@ IMPORTANT:
                 context_utilization_rate=0
             )
         
-        total_uses = len(usages)
-        processing_times = [u.processing_time_ms for u in usages if u.processing_time_ms]
-        avg_processing_time = sum(processing_times) / len(processing_times) if processing_times else 0
-        
-        # Calculate confidence distribution
-        confidence_scores = [u.confidence_score for u in usages if u.confidence_score]
-        high_confidence = len([c for c in confidence_scores if c == "HIGH"])
-        avg_confidence = "HIGH" if high_confidence / len(confidence_scores) > 0.6 else "MEDIUM" if confidence_scores else "UNKNOWN"
-        
-        corrections_made = [u.corrections_count for u in usages if u.corrections_count > 0]
-        correction_rate = len(corrections_made) / total_uses if total_uses > 0 else 0
-        
-        context_used = [u.context_turns_used for u in usages if u.context_turns_used > 0]
-        context_utilization_rate = len(context_used) / total_uses if total_uses > 0 else 0
+        avg_processing_time = avg_processing_time or 0
+        if not confidence_count:
+            avg_confidence = "UNKNOWN"
+        else:
+            avg_confidence = "HIGH" if high_confidence / confidence_count > 0.6 else "MEDIUM"
+        correction_rate = corrected_uses / total_uses
+        context_utilization_rate = context_uses / total_uses
         
         return PromptPerformanceMetrics(
             template_id=str(template_id),
@@ -322,7 +389,8 @@ IMPORTANT:
                            traffic_split: int = 50) -> ABTest:
         """Create a new A/B test"""
         
-        ab_test = ABTest(
+        ab_test = _insert_returning(
+            db, ABTest,
             name=name,
             description=description,
             prompt_a_id=prompt_a_id,
@@ -330,10 +398,6 @@ IMPORTANT:
             traffic_split_percent=traffic_split
         )
         
-        db.add(ab_test)
-        db.commit()
-        db.refresh(ab_test)
-        
         logger.info(f"Created A/B test: {name} ({ab_test.id})")
         return ab_test
 
@@ -371,17 +435,18 @@ IMPORTANT:
         
         db.add(result)
         db.commit()
-        db.refresh(result)
         
         return result
 
     async def get_prompt_insights(self, db: Session) -> PromptInsights:
         """Get comprehensive insights for prompt engineering"""
         
-        total_usage_count = db.query(func.count(PromptUsage.id)).scalar() or 0
-        
-        # Calculate average token usage
-        avg_tokens = db.query(func.avg(PromptUsage.token_count)).scalar() or 0
+        # Usage count and average token usage in one aggregate pass
+        total_usage_count, avg_tokens = db.query(
+            func.count(PromptUsage.id), func.avg(PromptUsage.token_count)
+        ).one()
+        total_usage_count = total_usage_count or 0
+        avg_tokens = avg_tokens or 0
         
         return PromptInsights(
             total_turns_processed=total_usage_count,
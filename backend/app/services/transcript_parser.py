@@ -10,6 +10,7 @@ Handles the specific format from example scripts:
 
 import re
 import logging
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
@@ -29,25 +30,31 @@ class ParsedTurn:
 class TranscriptParser:
     """Parses raw conversation transcripts into structured turn data"""
     
-    def __init__(self):
-        # Pattern to match VT tags like ##VT_ENGAGING_HELPFUL##
-        self.vt_tag_pattern = re.compile(r'##VT_[A-Z_]+##')
-        
-        # Pattern to match noise markers
-        self.noise_pattern = re.compile(r'<noise>')
-        
-        # Pattern to detect likely foreign text (non-ASCII characters)
-        self.foreign_text_pattern = re.compile(r'[^\x00-\x7F]+')
-        
-        # Common speaker labels and their normalization
-        self.speaker_mappings = {
-            'AI': 'Lumen',
-            'Assistant': 'Lumen', 
-            'Lumen': 'Lumen',
-            'User': 'User',
-            'Human': 'User',
-            'Customer': 'User'
-        }
+    # Patterns are compiled once at import and shared by every parser instance
+    
+    # Pattern to match VT tags like ##VT_ENGAGING_HELPFUL##
+    vt_tag_pattern = re.compile(r'##VT_[A-Z_]+##')
+    
+    # Pattern to match noise markers
+    noise_pattern = re.compile(r'<noise>')
+    
+    # Pattern to detect likely foreign text (non-ASCII characters)
+    foreign_text_pattern = re.compile(r'[^\x00-\x7F]+')
+    
+    # Patterns used to normalize whitespace and ellipses in turn content
+    whitespace_pattern = re.compile(r'\s+')
+    dots_pattern = re.compile(r'\.{3,}')
+    ellipsis_pattern = re.compile(r'…{2,}')
+    
+    # Common speaker labels and their normalization
+    speaker_mappings = {
+        'AI': 'Lumen',
+        'Assistant': 'Lumen', 
+        'Lumen': 'Lumen',
+        'User': 'User',
+        'Human': 'User',
+        'Customer': 'User'
+    }
     
     def parse_transcript(self, raw_transcript: str) -> List[ParsedTurn]:
         """
@@ -101,10 +108,10 @@ class TranscriptParser:
         
         logger.info(f"Parsed {len(turns)} turns from transcript")
         
-        # Log summary
-        user_turns = sum(1 for turn in turns if turn.speaker == 'User')
-        lumen_turns = sum(1 for turn in turns if turn.speaker == 'Lumen')
-        logger.info(f"Turn breakdown: {user_turns} User, {lumen_turns} Lumen")
+        # Log summary (counting costs a pass over the turns, so only when it will be shown)
+        if logger.isEnabledFor(logging.INFO):
+            user_turns = sum(1 for turn in turns if turn.speaker == 'User')
+            logger.info(f"Turn breakdown: {user_turns} User, {len(turns) - user_turns} Lumen")
         
         return turns
     
@@ -138,11 +145,11 @@ class TranscriptParser:
         has_foreign_text = bool(self.foreign_text_pattern.search(cleaned_content))
         
         # Clean up extra whitespace
-        cleaned_content = re.sub(r'\s+', ' ', cleaned_content).strip()
+        cleaned_content = self.whitespace_pattern.sub(' ', cleaned_content).strip()
         
         # Remove excessive dots/ellipses
-        cleaned_content = re.sub(r'\.{3,}', '...', cleaned_content)
-        cleaned_content = re.sub(r'…{2,}', '...', cleaned_content)
+        cleaned_content = self.dots_pattern.sub('...', cleaned_content)
+        cleaned_content = self.ellipsis_pattern.sub('...', cleaned_content)
         
         logger.debug(f"Turn {turn_index} ({speaker}): {len(vt_tags)} VT tags, "
                     f"noise={has_noise}, foreign={has_foreign_text}")
@@ -158,28 +165,38 @@ class TranscriptParser:
         )
     
     def get_parsing_stats(self, turns: List[ParsedTurn]) -> Dict[str, Any]:
-        """Get statistics about the parsed transcript"""
+        """Get statistics about the parsed transcript in a single pass over the turns"""
         if not turns:
             return {}
         
-        total_turns = len(turns)
-        user_turns = sum(1 for turn in turns if turn.speaker == 'User')
-        lumen_turns = sum(1 for turn in turns if turn.speaker == 'Lumen')
-        
-        vt_tag_counts = {}
+        user_turns = 0
+        lumen_turns = 0
         noise_turns = 0
         foreign_text_turns = 0
+        total_chars = 0
+        longest = 0
+        shortest = None
+        vt_tag_counts = Counter()
         
         for turn in turns:
+            if turn.speaker == 'User':
+                user_turns += 1
+            elif turn.speaker == 'Lumen':
+                lumen_turns += 1
             if turn.has_noise:
                 noise_turns += 1
             if turn.has_foreign_text:
                 foreign_text_turns += 1
+            vt_tag_counts.update(turn.vt_tags)
             
-            for tag in turn.vt_tags:
-                vt_tag_counts[tag] = vt_tag_counts.get(tag, 0) + 1
+            length = len(turn.raw_text)
+            total_chars += length
+            if length > longest:
+                longest = length
+            if shortest is None or length < shortest:
+                shortest = length
         
-        avg_turn_length = sum(len(turn.raw_text) for turn in turns) / total_turns
+        total_turns = len(turns)
         
         return {
             'total_turns': total_turns,
@@ -187,8 +204,12 @@ class TranscriptParser:
             'lumen_turns': lumen_turns,
             'turns_with_noise': noise_turns,
             'turns_with_foreign_text': foreign_text_turns,
-            'vt_tag_counts': vt_tag_counts,
-            'avg_turn_length_chars': round(avg_turn_length, 1),
-            'longest_turn_chars': max(len(turn.raw_text) for turn in turns),
-            'shortest_turn_chars': min(len(turn.raw_text) for turn in turns)
-        }
\ No newline at end of file
+            'vt_tag_counts': dict(vt_tag_counts),
+            'avg_turn_length_chars': round(total_chars / total_turns, 1),
+            'longest_turn_chars': longest,
+            'shortest_turn_chars': shortest
+        }
+
+
+# Shared parser instance; the parser holds no per-transcript state
+transcript_parser = TranscriptParser()
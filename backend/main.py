@@ -4,6 +4,7 @@ from fastapi.security import HTTPBearer
 import uvicorn
 import os
 from dotenv import load_dotenv
+from app.core.responses import UTCORJSONResponse
 
 # Load environment variables
 load_dotenv()
@@ -14,7 +15,8 @@ app = FastAPI(
     description="AI-powered conversation cleaning system implementing cleanercontext.md vision",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=UTCORJSONResponse
 )
 
 # CORS middleware for frontend communication
@@ -48,9 +50,13 @@ async def root():
         "health": "/health"
     }
 
+# Log through a background queue so handlers never block on stderr
+from app.core.logging_config import setup_logging
+setup_logging()
+
 # API v1 routes will be added here
-from app.api.v1 import api_router
-app.include_router(api_router, prefix="/api/v1")
+from app.api.v1 import include_api_routes
+include_api_routes(app, prefix="/api/v1")
 
 if __name__ == "__main__":
     uvicorn.run(
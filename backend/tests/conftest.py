@@ -9,6 +9,7 @@ from sqlalchemy.pool import StaticPool
 from app.main import app
 from app.core.database import get_db, Base
 from app.core.auth import AuthManager
+from app.services.prompt_engineering_service import PromptEngineeringService
 
 # Create in-memory SQLite database for testing
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -18,7 +19,7 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -38,6 +39,13 @@ def db_session():
         session.close()
         Base.metadata.drop_all(bind=engine)
 
+@pytest.fixture(autouse=True)
+def reset_default_template_cache():
+    """Keep the process-wide default template cache from leaking between tests."""
+    PromptEngineeringService._default_template_cache = None
+    yield
+    PromptEngineeringService._default_template_cache = None
+
 @pytest.fixture
 def client(db_session):
     """Create a test client that uses the test database."""
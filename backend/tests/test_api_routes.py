@@ -0,0 +1,13 @@
+import importlib
+
+import pytest
+
+from app.api.v1 import ROUTE_MODULES
+
+
+@pytest.mark.parametrize("name", [name for name, _, _ in ROUTE_MODULES])
+def test_route_module_imports(name: str):
+    """Test every v1 route module imports, even when SIDELINE_MODULES leaves it unmounted."""
+    module = importlib.import_module(f"app.api.v1.{name}")
+    
+    assert module.router.routes
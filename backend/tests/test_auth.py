@@ -47,10 +47,73 @@ class TestAuthManager:
         mock_decode.side_effect = JWTError("Token expired")
         
         result = auth_manager.verify_supabase_token('expired_token')
-        
+
         assert result is None
         mock_decode.assert_called_once()
 
+    @patch('app.core.auth.jwt.decode')
+    def test_verify_token_cached(self, mock_decode, auth_manager, test_user_data):
+        """Test repeat verification of a valid token skips decoding."""
+        mock_decode.return_value = {
+            'sub': test_user_data['id'],
+            'email': test_user_data['email'],
+            'exp': 9999999999
+        }
+
+        first = auth_manager.verify_supabase_token('valid_token')
+        second = auth_manager.verify_supabase_token('valid_token')
+
+        assert first == second
+        mock_decode.assert_called_once()
+
+    @patch('app.core.auth.jwt.decode')
+    def test_verify_token_cache_returns_copy(self, mock_decode, auth_manager, test_user_data):
+        """Test mutating returned claims does not alter the cached entry."""
+        mock_decode.return_value = {'sub': test_user_data['id'], 'exp': 9999999999}
+
+        auth_manager.verify_supabase_token('valid_token')['sub'] = 'tampered'
+        auth_manager.verify_supabase_token('valid_token')['role'] = 'admin'
+
+        assert auth_manager.verify_supabase_token('valid_token') == {
+            'sub': test_user_data['id'], 'exp': 9999999999
+        }
+        mock_decode.assert_called_once()
+
+    @patch('app.core.auth.jwt.decode')
+    def test_verify_token_cache_evicts_oldest(self, mock_decode, auth_manager, test_user_data):
+        """Test a full cache evicts its oldest entry."""
+        mock_decode.return_value = {'sub': test_user_data['id'], 'exp': 9999999999}
+
+        with patch('app.core.auth.TOKEN_CACHE_MAX_SIZE', 2):
+            for token in ('token_a', 'token_b', 'token_c'):
+                auth_manager.verify_supabase_token(token)
+            assert len(auth_manager._token_cache) == 2
+            auth_manager.verify_supabase_token('token_a')
+
+        assert mock_decode.call_count == 4
+
+    @patch('app.core.auth.jwt.decode')
+    def test_verify_token_failure_not_cached(self, mock_decode, auth_manager):
+        """Test failed verifications are retried rather than cached."""
+        from jose import JWTError
+        mock_decode.side_effect = JWTError("Invalid token")
+
+        auth_manager.verify_supabase_token('invalid_token')
+        auth_manager.verify_supabase_token('invalid_token')
+
+        assert mock_decode.call_count == 2
+
+    @patch('app.core.auth.jwt.decode')
+    def test_verify_token_cache_disabled(self, mock_decode, auth_manager, test_user_data):
+        """Test SIDELINE_TOKEN_CACHE=disabled verifies every call."""
+        mock_decode.return_value = {'sub': test_user_data['id'], 'exp': 9999999999}
+
+        with patch.object(settings, 'TOKEN_CACHE_ENABLED', False):
+            auth_manager.verify_supabase_token('valid_token')
+            auth_manager.verify_supabase_token('valid_token')
+
+        assert mock_decode.call_count == 2
+
 
 class TestAuthEndpoints:
     """Test authentication endpoints."""
@@ -112,6 +175,27 @@ class TestAuthEndpoints:
         assert response.status_code == 401
         data = response.json()
         assert 'detail' in data
+    
+    def test_login_response_construct_round_trip(self, test_user_data):
+        """Test the unvalidated login response dumps like a validated one."""
+        from app.api.v1.auth import _build_login_response
+        from app.schemas.auth import LoginResponse
+        auth_result = {
+            'access_token': 'test_access_token',
+            'refresh_token': 'test_refresh_token',
+            'user': {
+                'id': test_user_data['id'],
+                'email': test_user_data['email'],
+                'created_at': test_user_data['created_at']
+            },
+            'expires_in': 3600
+        }
+        
+        constructed = _build_login_response(auth_result)
+        
+        assert constructed.model_dump() == LoginResponse(**auth_result).model_dump()
+        assert constructed.user.is_active is True
+        assert constructed.token_type == 'bearer'
 
 
 class TestAuthMiddleware:
@@ -7,12 +7,14 @@ and turn processing pipeline.
 
 import pytest
 import time
-from unittest.mock import Mock, patch
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 from sqlalchemy.orm import Session
 
 from app.services.conversation_manager import ConversationManager, ConversationState
 from app.models.conversation import Conversation
+from app.models.prompt_template import PromptUsage
 from app.models.turn import Turn
 
 class TestConversationState:
@@ -109,7 +111,26 @@ class TestConversationManager:
         
         # Should be the same instance
         assert state1 is state2
-    
+
+    def test_get_conversation_state_reloads_history(self, manager, db_session):
+        """Test a new conversation state is rebuilt from stored turns in order"""
+        conversation = Conversation(user_id=uuid4(), name="Reloaded", conversation_metadata={})
+        db_session.add(conversation)
+        db_session.flush()
+        for minute, (speaker, text) in enumerate([("User", "first"), ("Lumen", "second")]):
+            db_session.add(Turn(
+                conversation_id=conversation.id, speaker=speaker, raw_text=text,
+                cleaned_text=text.title(), gemini_prompt="not part of the context",
+                created_at=datetime(2025, 1, 1, 12, minute, tzinfo=timezone.utc)
+            ))
+        db_session.commit()
+
+        state = manager.get_conversation_state(conversation.id, db=db_session)
+
+        assert [t['cleaned_text'] for t in state.cleaned_history] == ["First", "Second"]
+        assert state.cleaned_history[0]['corrections'] == []
+        assert 'gemini_prompt' not in state.cleaned_history[0]
+
     def test_is_lumen_turn_detection(self, manager):
         """Test Lumen turn detection logic"""
         assert manager._is_lumen_turn('Lumen') == True
@@ -280,6 +301,140 @@ class TestConversationManager:
         context_text = ' '.join([turn['cleaned_text'] for turn in context])
         assert 'Director of' in context_text or 'vector of' not in context_text
     
+    @pytest.mark.asyncio
+    async def test_add_turns_bulk_single_insert(self, manager, mock_db):
+        """Test bulk turns are written with one multi-row INSERT and one commit"""
+        conversation_id = uuid4()
+        # Start from in-memory state so only the writes reach the session
+        manager.get_conversation_state(conversation_id)
+        
+        results = await manager.add_turns_bulk(
+            conversation_id=conversation_id,
+            turns=[
+                {'speaker': 'Lumen', 'raw_text': 'How can I help today?'},
+                {'speaker': 'Lumen', 'raw_text': 'Tell me about your role.'},
+                {'speaker': 'User', 'raw_text': 'ok'}
+            ],
+            db=mock_db,
+            batch_size=2
+        )
+        
+        assert [r['raw_text'] for r in results] == [
+            'How can I help today?', 'Tell me about your role.', 'ok'
+        ]
+        assert len({r['turn_id'] for r in results}) == 3
+        mock_db.add.assert_not_called()
+        # Two INSERT batches plus the turns_count UPDATE
+        assert mock_db.execute.call_count == 3
+        rows = mock_db.execute.call_args_list[0].args[1]
+        assert [row['raw_text'] for row in rows] == ['How can I help today?', 'Tell me about your role.']
+        assert mock_db.execute.call_args_list[2].args[0].is_update
+        mock_db.commit.assert_called_once()
+        
+        state = manager.get_conversation_state(conversation_id)
+        assert len(state.cleaned_history) == 3
+    
+    @pytest.mark.asyncio
+    async def test_add_turns_bulk_failure_restores_history(self, manager, mock_db):
+        """Test a failed bulk write rolls back and leaves the history as it was"""
+        conversation_id = uuid4()
+        state = manager.get_conversation_state(conversation_id)
+        state.add_to_history({'speaker': 'Lumen', 'raw_text': 'Hi', 'cleaned_text': 'Hi'})
+        mock_db.execute.side_effect = RuntimeError("insert failed")
+        
+        with pytest.raises(RuntimeError):
+            await manager.add_turns_bulk(
+                conversation_id=conversation_id,
+                turns=[{'speaker': 'Lumen', 'raw_text': 'How can I help today?'}],
+                db=mock_db
+            )
+        
+        mock_db.rollback.assert_called_once()
+        mock_db.commit.assert_not_called()
+        assert [turn['raw_text'] for turn in state.cleaned_history] == ['Hi']
+    
+    @pytest.mark.asyncio
+    async def test_add_turns_bulk_failure_leaves_no_prompt_usage(self, manager, db_session):
+        """Test prompt usage rows for a failed batch are rolled back with its turns"""
+        conversation = Conversation(user_id=uuid4(), name="Bulk", conversation_metadata={})
+        db_session.add(conversation)
+        db_session.commit()
+        turns = [{'speaker': 'User', 'raw_text': 'we use book marketing strategies'}]
+        # Skip the Gemini call and give the turn a prompt to log usage for
+        manager.gemini_service.clean_conversation_turn = Mock(side_effect=RuntimeError("offline"))
+        manager.prompt_service.render_prompt = AsyncMock(return_value=Mock(rendered_prompt="Rendered prompt"))
+        
+        execute = db_session.execute
+        def failing_execute(statement, *args, **kwargs):
+            if getattr(statement, 'is_insert', False) and statement.table.name == 'turns':
+                raise RuntimeError("insert failed")
+            return execute(statement, *args, **kwargs)
+        
+        with patch.object(db_session, 'execute', side_effect=failing_execute):
+            with pytest.raises(RuntimeError):
+                await manager.add_turns_bulk(conversation.id, turns, db=db_session)
+        assert db_session.query(PromptUsage).count() == 0
+        assert db_session.query(Turn).count() == 0
+        
+        await manager.add_turns_bulk(conversation.id, turns, db=db_session)
+        assert db_session.query(PromptUsage).count() == 1
+        db_session.expire_all()
+        assert db_session.get(Conversation, conversation.id).turns_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_add_lumen_turn_fast(self, manager, db_session):
+        """Test Lumen fast path stores the turn and extends in-memory context"""
+        conversation_id = uuid4()
+        state = manager.get_conversation_state(conversation_id)
+        
+        result = await manager.add_turn(
+            conversation_id=conversation_id,
+            speaker='Lumen',
+            raw_text='Thanks for sharing that.',
+            db=db_session
+        )
+        
+        stored = db_session.query(Turn).one()
+        assert result['turn_id'] == str(stored.id)
+        assert result['cleaned_text'] == 'Thanks for sharing that.'
+        assert result['metadata']['cleaning_level'] == 'none'
+        assert stored.cleaned_text == 'Thanks for sharing that.'
+        assert state.cleaned_history[-1]['raw_text'] == 'Thanks for sharing that.'
+        assert len(manager.performance_metrics['lumen_processing_times']) == 1
+    
+    @pytest.mark.asyncio
+    async def test_add_lumen_turn_fast_db_error(self, manager, mock_db):
+        """Test Lumen fast path rolls back and falls back to a mock turn on DB error"""
+        conversation_id = uuid4()
+        state = manager.get_conversation_state(conversation_id)
+        mock_db.execute.side_effect = RuntimeError("database unavailable")
+        
+        result = await manager.add_turn(
+            conversation_id=conversation_id,
+            speaker='Lumen',
+            raw_text='Thanks for sharing that.',
+            db=mock_db
+        )
+        
+        mock_db.rollback.assert_called_once()
+        mock_db.commit.assert_not_called()
+        assert result['cleaned_text'] == 'Thanks for sharing that.'
+        assert state.cleaned_history[-1]['raw_text'] == 'Thanks for sharing that.'
+    
+    @pytest.mark.asyncio
+    async def test_add_turn_returns_stored_row(self, manager, db_session):
+        """Test add_turn reports the id and created_at it wrote without refreshing"""
+        result = await manager.add_turn(
+            conversation_id=uuid4(),
+            speaker='Lumen',
+            raw_text='What does your team do?',
+            db=db_session
+        )
+        
+        stored = db_session.query(Turn).one()
+        assert result['turn_id'] == str(stored.id)
+        assert result['created_at'].startswith(stored.created_at.isoformat()[:19])
+    
     def test_performance_metrics_tracking(self, manager):
         """Test performance metrics collection"""
         # Initially empty
@@ -122,6 +122,130 @@ class TestConversationEndpoints:
         data = response.json()
         assert 'detail' in data
     
+    def test_get_conversation_ownership(self, client, db_session, test_user_data):
+        """Test a conversation is only visible to the user who owns it."""
+        import uuid
+        from app.main import app
+        from app.core.auth import get_current_user
+        from app.models import Conversation
+        
+        conversation = Conversation(
+            user_id=uuid.UUID(test_user_data['id']),
+            name="Owned Conversation",
+            conversation_metadata={}
+        )
+        db_session.add(conversation)
+        db_session.commit()
+        url = f'/api/v1/conversations/{conversation.id}'
+        
+        app.dependency_overrides[get_current_user] = lambda: test_user_data
+        assert client.get(url).status_code == 200
+        
+        app.dependency_overrides[get_current_user] = lambda: {
+            "id": "550e8400-e29b-41d4-a716-446655440001",
+            "email": "other@example.com"
+        }
+        assert client.get(url).status_code == 404
+
+    def test_delete_conversation_ownership(self, client, db_session, test_user_data):
+        """Test delete removes the owner's conversation and its turns, and nobody else's."""
+        import uuid
+        from app.main import app
+        from app.core.auth import get_current_user
+        from app.models import Conversation, Turn
+        
+        conversation = Conversation(
+            user_id=uuid.UUID(test_user_data['id']),
+            name="Doomed Conversation",
+            conversation_metadata={}
+        )
+        db_session.add(conversation)
+        db_session.flush()
+        db_session.add(Turn(
+            conversation_id=conversation.id, speaker="User", raw_text="hello there", cleaned_text="Hello there."
+        ))
+        db_session.commit()
+        conversation_id = conversation.id
+        url = f'/api/v1/conversations/{conversation_id}'
+        
+        app.dependency_overrides[get_current_user] = lambda: {
+            "id": "550e8400-e29b-41d4-a716-446655440001",
+            "email": "other@example.com"
+        }
+        assert client.delete(url).status_code == 404
+        assert db_session.query(Turn).count() == 1
+        
+        app.dependency_overrides[get_current_user] = lambda: test_user_data
+        assert client.delete(url).status_code == 200
+        db_session.expire_all()
+        assert db_session.get(Conversation, conversation_id) is None
+        assert db_session.query(Turn).count() == 0
+
+    def test_non_uuid_subject_unauthorized(self, client):
+        """Test a token subject that is not a UUID is rejected rather than erroring."""
+        import uuid
+        from app.main import app
+        from app.core.auth import get_current_user
+        
+        app.dependency_overrides[get_current_user] = lambda: {
+            "id": "not-a-uuid",
+            "email": "test@example.com"
+        }
+        assert client.get('/api/v1/conversations').status_code == 401
+        assert client.get(f'/api/v1/conversations/{uuid.uuid4()}').status_code == 401
+        assert client.delete(f'/api/v1/conversations/{uuid.uuid4()}').status_code == 401
+
+    def test_list_conversations_serializes_rows(self, client, db_session, test_user_data):
+        """Test the list endpoint's plain-dict response keeps the schema's shape."""
+        import uuid
+        from app.main import app
+        from app.core.auth import get_current_user
+        from app.models import Conversation
+        from app.schemas.conversations import ListConversationsResponse
+
+        conversation = Conversation(
+            user_id=uuid.UUID(test_user_data['id']),
+            name="Listed Conversation",
+            conversation_metadata={"source": "test"}
+        )
+        db_session.add(conversation)
+        db_session.commit()
+
+        app.dependency_overrides[get_current_user] = lambda: test_user_data
+        response = client.get('/api/v1/conversations')
+
+        assert response.status_code == 200
+        data = ListConversationsResponse(**response.json())
+        assert data.total == 1
+        assert data.conversations[0].id == conversation.id
+        assert data.conversations[0].metadata == {"source": "test"}
+        assert data.conversations[0].created_at.tzinfo is not None
+
+    def test_list_and_get_timestamps_match(self, client, db_session, test_user_data):
+        """Test the dict-built list response formats timestamps like the response_model endpoints."""
+        import uuid
+        from datetime import datetime
+        from app.main import app
+        from app.core.auth import get_current_user
+        from app.models import Conversation
+
+        conversation = Conversation(
+            user_id=uuid.UUID(test_user_data['id']),
+            name="Timestamped Conversation",
+            conversation_metadata={},
+            created_at=datetime(2025, 1, 20, 9, 30, 15, 123456),
+            updated_at=datetime(2025, 1, 20, 9, 45)
+        )
+        db_session.add(conversation)
+        db_session.commit()
+
+        app.dependency_overrides[get_current_user] = lambda: test_user_data
+        listed = client.get('/api/v1/conversations').json()['conversations'][0]
+        fetched = client.get(f'/api/v1/conversations/{conversation.id}').json()
+
+        assert listed['created_at'] == fetched['created_at'] == '2025-01-20T09:30:15.123456Z'
+        assert listed['updated_at'] == fetched['updated_at'] == '2025-01-20T09:45:00Z'
+
     @patch('app.core.auth.get_current_user')
     def test_delete_conversation_success(self, mock_auth, client, test_user_data, test_conversation_data):
         """Test deleting a conversation."""
@@ -47,4 +47,22 @@ def test_health_check_structure(client: TestClient):
         assert field in data, f"Missing required field: {field}"
     
     assert data["version"] == "1.0.0"
-    assert data["environment"] == "development"
\ No newline at end of file
+    assert data["environment"] == "development"
+
+def test_sideline_modules_limits_mounted_routes(monkeypatch):
+    """Test SIDELINE_MODULES mounts only the listed v1 route modules."""
+    from fastapi import FastAPI
+    from app.api.v1 import include_api_routes
+    from app.core.config import settings
+    
+    monkeypatch.setattr(settings, "ENABLED_MODULES", ["health"])
+    app = FastAPI()
+    include_api_routes(app)
+    paths = set(app.openapi()["paths"])
+    
+    assert "/api/v1/health" in paths
+    assert not any(path.startswith("/api/v1/conversations") for path in paths)
+    
+    monkeypatch.setattr(settings, "ENABLED_MODULES", ["health", "evaluations"])
+    with pytest.raises(ValueError):
+        include_api_routes(FastAPI())
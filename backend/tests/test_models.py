@@ -354,4 +354,33 @@ class TestModelPerformance:
         
         # Verify all turns were created
         turn_count = db_session.query(Turn).filter_by(conversation_id=conversation.id).count()
-        assert turn_count == 50
\ No newline at end of file
+        assert turn_count == 50
+
+class TestUuid7:
+    """Test time-ordered primary key generation."""
+    
+    def test_uuid7_version_and_variant(self):
+        """Test generated ids are RFC 9562 version 7 UUIDs."""
+        from app.core.database import uuid7
+        
+        value = uuid7()
+        
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+    
+    def test_uuid7_time_ordered(self):
+        """Test ids generated in later milliseconds sort after earlier ones."""
+        import time
+        from app.core.database import uuid7
+        
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        
+        assert first < second
+    
+    def test_turn_default_id_is_uuid7(self):
+        """Test turns get a time-ordered id by default."""
+        column_default = Turn.__table__.c.id.default
+        
+        assert column_default.arg(None).version == 7
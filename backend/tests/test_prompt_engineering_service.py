@@ -0,0 +1,99 @@
+"""
+Test suite for PromptEngineeringService - prompt template management
+
+Tests default template caching, template writes, and prompt usage analytics.
+"""
+
+import pytest
+from unittest.mock import patch
+from uuid import uuid4
+
+from app.services.prompt_engineering_service import PromptEngineeringService
+from app.models.prompt_template import PromptTemplate
+
+class TestPromptEngineeringService:
+    """Test PromptEngineeringService template and analytics operations"""
+    
+    @pytest.fixture
+    def prompt_service(self):
+        """Create a PromptEngineeringService instance for testing"""
+        return PromptEngineeringService()
+    
+    @pytest.mark.asyncio
+    async def test_default_template_cached(self, prompt_service, db_session):
+        """Test the default template is served from cache until a template write"""
+        first = await prompt_service.get_or_create_default_template(db_session)
+        
+        with patch.object(db_session, 'query', side_effect=AssertionError("cache miss")):
+            cached = await prompt_service.get_or_create_default_template(db_session)
+        assert cached.id == first.id
+        assert cached.template == first.template
+        
+        await prompt_service.update_template(db_session, first.id, description="edited")
+        refreshed = await prompt_service.get_or_create_default_template(db_session)
+        assert refreshed.description == "edited"
+    
+    @pytest.mark.asyncio
+    async def test_template_writes_use_returning(self, prompt_service, db_session):
+        """Test template update/activate report missing ids without side effects"""
+        default = await prompt_service.get_or_create_default_template(db_session)
+        other = await prompt_service.create_template(db_session, "Other", "Clean {raw_text}")
+        
+        updated = await prompt_service.update_template(db_session, other.id, template="Fix {raw_text} {cleaning_level}")
+        assert sorted(updated.variables) == ['cleaning_level', 'raw_text']
+        assert await prompt_service.update_template(db_session, uuid4(), name="Missing") is None
+        
+        assert await prompt_service.set_active_template(db_session, uuid4()) is False
+        assert db_session.get(PromptTemplate, default.id).is_active is True
+        assert await prompt_service.set_active_template(db_session, other.id) is True
+        db_session.expire_all()
+        assert db_session.get(PromptTemplate, default.id).is_active is False
+        assert db_session.get(PromptTemplate, other.id).is_active is True
+    
+    @pytest.mark.asyncio
+    async def test_turn_prompt_analysis(self, prompt_service, db_session):
+        """Test prompt analysis loads a turn's usage and template together"""
+        template = await prompt_service.get_or_create_default_template(db_session)
+        turn_id = uuid4()
+        await prompt_service.log_prompt_usage(
+            db_session, template.id, "Rendered prompt text", {'raw_text': 'hi'}, turn_id=turn_id
+        )
+        
+        analysis = await prompt_service.get_turn_prompt_analysis(db_session, turn_id)
+        
+        assert analysis.template_used.name == template.name
+        assert analysis.rendered_prompt.rendered_prompt == "Rendered prompt text"
+        assert await prompt_service.get_turn_prompt_analysis(db_session, uuid4()) is None
+        
+        insights = await prompt_service.get_prompt_insights(db_session)
+        assert insights.total_turns_processed == 1
+    
+    @pytest.mark.asyncio
+    async def test_template_performance(self, prompt_service, db_session):
+        """Test template performance metrics are aggregated per template"""
+        template = await prompt_service.get_or_create_default_template(db_session)
+        other = await prompt_service.create_template(db_session, "Other", "Clean {raw_text}")
+        for processing_time_ms, confidence_score, corrections_count, variables in [
+            (120.0, "HIGH", 1, {}),
+            (None, "HIGH", 0, {}),
+            (60.0, "LOW", 0, {'conversation_context': 'User: hi\nLumen: hello'}),
+        ]:
+            await prompt_service.log_prompt_usage(
+                db_session, template.id, "Rendered prompt text", variables,
+                processing_time_ms=processing_time_ms, confidence_score=confidence_score,
+                corrections_count=corrections_count
+            )
+        await prompt_service.log_prompt_usage(db_session, other.id, "Other prompt", {}, processing_time_ms=10.0)
+
+        metrics = await prompt_service.get_template_performance(db_session, template.id)
+
+        assert metrics.total_uses == 3
+        assert metrics.avg_processing_time_ms == 90.0
+        assert metrics.avg_confidence_score == "HIGH"
+        assert metrics.correction_rate == pytest.approx(1 / 3)
+        assert metrics.context_utilization_rate == pytest.approx(1 / 3)
+
+        other_metrics = await prompt_service.get_template_performance(db_session, other.id)
+        assert other_metrics.total_uses == 1
+        assert other_metrics.avg_confidence_score == "UNKNOWN"
+        assert (await prompt_service.get_template_performance(db_session, uuid4())).total_uses == 0